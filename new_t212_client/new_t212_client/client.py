@@ -1,26 +1,104 @@
 """HTTP client wrapper for Trading 212."""
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from collections import OrderedDict
 from contextlib import AbstractContextManager
-from typing import Any, Iterable, Mapping
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Hashable, Iterable, Mapping
 
 import httpx
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from .auth import build_auth_headers
 from .config import Settings, get_settings
 from .rate_limiter import rate_limiter as shared_rate_limiter
+from .utils import loads_payload
+
+LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = httpx.Timeout(30.0)
+# Idle connections must outlive the 12s history pacing, or every page pays a new TLS handshake
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+# HTTP/2 multiplexing needs the optional ``h2`` package (``httpx[http2]``).
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Connection failures are retried inside the pool, without tearing down live connections
+TRANSPORT_RETRIES = 3
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1.0
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Last (ETag, body) per conditional request, shared by every client in the process so a
+# warm scheduler revalidates instead of re-downloading unchanged metadata
+ETAG_CACHE_SIZE = 32
+
+
+class _ETagCache:
+    """Thread-safe LRU of ``(ETag, body)`` keyed on base URL, path and params."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[str, bytes] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: tuple[str, bytes]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+_ETAG_CACHE = _ETagCache(ETAG_CACHE_SIZE)
+
+
+@lru_cache(maxsize=256)
+def _normalise_path(path: str) -> str:
+    """Strip leading slashes and the ``api/v0/`` prefix; memoized per distinct path."""
+
+    if path.startswith(("http://", "https://")):
+        return path
+    cleaned = path.lstrip("/")
+    if cleaned.startswith("api/v0/"):
+        cleaned = cleaned[len("api/v0/"):]
+    return cleaned
 
 
 class T212Client(AbstractContextManager["T212Client"]):
-    """Simple synchronous Trading 212 API client."""
+    """Synchronous Trading 212 API client backed by a pooled keep-alive session.
+
+    A single instance is safe to share between threads, so independent
+    endpoints can be fetched concurrently over the same connection pool.
+    """
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
-        self._client = httpx.Client(base_url=self.settings.base_url, timeout=DEFAULT_TIMEOUT)
+        self._headers = dict(build_auth_headers(self.settings))
+        self._client = httpx.Client(
+            base_url=self.settings.base_url,
+            timeout=DEFAULT_TIMEOUT,
+            headers=self._headers,
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=DEFAULT_LIMITS,
+                retries=TRANSPORT_RETRIES,
+            ),
+        )
         self._rate_limiter = shared_rate_limiter
+        self._protocol_logged = False
 
     def __enter__(self) -> "T212Client":  # pragma: no cover trivial
         return self
@@ -32,38 +110,114 @@ class T212Client(AbstractContextManager["T212Client"]):
         '''Close underlying HTTP client.'''  # pragma: no cover trivial
         self._client.close()
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=2, max=60),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.HTTPStatusError)),
-    )
     def get(self, path: str, params: Mapping[str, Any] | None = None, *,
-            label: str | None = None) -> httpx.Response:
-        """Issue a GET request with shared headers and retry strategy."""
+            label: str | None = None,
+            headers: Mapping[str, str] | None = None) -> httpx.Response:
+        """Issue a GET request with shared headers, pacing and retry strategy.
 
-        rate_limit_key = label or path
-        self._rate_limiter.wait(rate_limit_key)
+        Connect failures are retried by the transport itself. HTTP 429 waits
+        exactly until ``x-ratelimit-reset``; remaining transport errors (e.g.
+        read timeouts) and 5xx responses back off exponentially. Other errors
+        are raised at once. ``headers`` are sent on top of the session headers;
+        a 304 answer to a conditional request is returned, not raised.
+        """
 
-        headers = build_auth_headers(self.settings)
+        rate_limit_key = label or path
         target = self._normalise_path(path)
-        response = self._client.get(target, params=params, headers=headers)
-        response.raise_for_status()
+        attempt = 0
+        reset_waited = False
+        while True:
+            attempt += 1
+            if reset_waited:
+                # The 429 branch already slept until x-ratelimit-reset; don't wait twice
+                reset_waited = False
+            else:
+                self._rate_limiter.wait(rate_limit_key)
+            try:
+                response = self._client.get(target, params=params, headers=headers)
+            except httpx.TransportError as exc:
+                if attempt >= MAX_ATTEMPTS:
+                    raise
+                delay = self._backoff_delay(attempt)
+                LOGGER.warning("  %s failed (%s) - retrying in %.1fs", target, exc, delay)
+                time.sleep(delay)
+                continue
+
+            if not self._protocol_logged:
+                # Once per session: confirms HTTP/2 and that later pages reuse the connection
+                self._protocol_logged = True
+                LOGGER.info("Connected to %s over %s", self.settings.base_url, response.http_version)
+
+            header_dict = {key: value for key, value in self.iter_rate_limit_headers(response)}
+            if header_dict:
+                self._rate_limiter.update_from_headers(rate_limit_key, header_dict)
+
+            status = response.status_code
+            if status == 429 and attempt < MAX_ATTEMPTS:
+                delay = self._seconds_until_reset(response, attempt)
+                LOGGER.warning("  429 from %s - retrying in %.1fs", target, delay)
+                time.sleep(delay)
+                reset_waited = True
+                continue
+            if status in RETRYABLE_STATUS_CODES and attempt < MAX_ATTEMPTS:
+                delay = self._backoff_delay(attempt)
+                LOGGER.warning("  %d from %s - retrying in %.1fs", status, target, delay)
+                time.sleep(delay)
+                continue
+
+            if status == 304 and headers:
+                return response
+            response.raise_for_status()
+            return response
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff for transient failures: 1s, 2s, 4s, ..."""
+
+        return BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+
+    def _seconds_until_reset(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds until the rate-limit window resets, falling back to backoff."""
+
+        reset = response.headers.get("x-ratelimit-reset")
+        if reset is None:
+            return self._backoff_delay(attempt)
+        try:
+            return max(0.0, int(reset) - time.time())
+        except ValueError:
+            return self._backoff_delay(attempt)
+
+    def get_json(self, path: str, params: Mapping[str, Any] | None = None, *,
+                 label: str | None = None, conditional: bool = False) -> Any:
+        """Issue a GET request and decode the JSON body straight from the raw bytes.
+
+        With ``conditional`` the body is remembered alongside its ``ETag`` and later
+        requests send ``If-None-Match``; a 304 decodes the remembered body instead
+        of downloading it again. Responses without an ``ETag`` are not cached.
+        """
+
+        if not conditional:
+            return loads_payload(self.get(path, params, label=label).content)
 
-        header_dict = {key: value for key, value in self.iter_rate_limit_headers(response)}
-        if header_dict:
-            self._rate_limiter.update_from_headers(rate_limit_key, header_dict)
-        return response
+        target = self._normalise_path(path)
+        # Keyed on the base URL too, so demo and live clients never share bodies
+        cache_key = (self.settings.base_url, target, tuple(sorted((params or {}).items())))
+        cached = _ETAG_CACHE.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.get(path, params, label=label, headers=headers)
+        if response.status_code == 304 and cached:
+            LOGGER.debug("%s not modified - reusing cached body", target)
+            return loads_payload(cached[1])
+
+        etag = response.headers.get("etag")
+        if etag:
+            _ETAG_CACHE.put(cache_key, (etag, response.content))
+        return loads_payload(response.content)
 
     def _normalise_path(self, path: str) -> str:
         """Convert form-agnostic endpoint paths into httpx-friendly targets."""
 
-        if path.startswith(("http://", "https://")):
-            return path
-        cleaned = path.lstrip("/")
-        if cleaned.startswith("api/v0/"):
-            cleaned = cleaned[len("api/v0/"):]
-        return cleaned
+        return _normalise_path(path)
 
     def iter_rate_limit_headers(self, response: httpx.Response) -> Iterable[tuple[str, str]]:
         """Yield rate-limit metadata which can be passed to the rate limiter."""
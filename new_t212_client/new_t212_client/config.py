@@ -30,6 +30,7 @@ class Settings(BaseSettings):
     sqlserver_trust_server_certificate: bool = Field(
         False, env="SQLSERVER_TRUST_SERVER_CERTIFICATE"
     )
+    sqlserver_bulk_batch_size: int = Field(10_000, gt=0, env="SQLSERVER_BULK_BATCH_SIZE")
 
     class Config:
         """Pydantic configuration."""
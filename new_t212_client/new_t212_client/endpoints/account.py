@@ -15,11 +15,9 @@ class AccountEndpoints:
     def fetch_cash(self) -> Mapping[str, Any]:
         """Pull `/equity/account/cash`."""
 
-        response = self.client.get("/equity/account/cash", label="/equity/account/cash")
-        return response.json()
+        return self.client.get_json("/equity/account/cash", label="/equity/account/cash")
 
     def fetch_info(self) -> Mapping[str, Any]:
         """Pull `/equity/account/info`."""
 
-        response = self.client.get("/equity/account/info", label="/equity/account/info")
-        return response.json()
+        return self.client.get_json("/equity/account/info", label="/equity/account/info")
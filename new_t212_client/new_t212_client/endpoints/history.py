@@ -14,17 +14,14 @@ class HistoryEndpoints:
 
     def fetch_orders(self, params: Mapping[str, Any] | None = None) -> Mapping[str, Any]:
         '''Fetch paginated historical orders.'''
-        response = self.client.get("/equity/history/orders",
+        return self.client.get_json("/equity/history/orders",
         params=params, label="/equity/history/orders")
-        return response.json()
 
     def fetch_dividends(self, params: Mapping[str, Any] | None = None) -> Mapping[str, Any]:
         '''Fetch paginated historical dividends.'''
-        response = self.client.get("/history/dividends", params=params, label="/history/dividends")
-        return response.json()
+        return self.client.get_json("/history/dividends", params=params, label="/history/dividends")
 
     def fetch_transactions(self, params: Mapping[str, Any] | None = None) -> Mapping[str, Any]:
         '''Fetch paginated historical transactions.'''
-        response = self.client.get("/history/transactions",
+        return self.client.get_json("/history/transactions",
         params=params, label="/history/transactions")
-        return response.json()
@@ -13,12 +13,11 @@ class MetadataEndpoints:
         self.client = client
 
     def fetch_exchanges(self) -> list[Mapping[str, Any]]:
-        '''Fetch available exchanges.'''
-        response = self.client.get("/equity/metadata/exchanges", label="/equity/metadata/exchanges")
-        return response.json()
+        '''Fetch available exchanges, revalidated by ETag when the API sends one.'''
+        return self.client.get_json("/equity/metadata/exchanges",
+        label="/equity/metadata/exchanges", conditional=True)
 
     def fetch_instruments(self) -> list[Mapping[str, Any]]:
-        '''Fetch available instruments.'''
-        response = self.client.get("/equity/metadata/instruments",
-        label="/equity/metadata/instruments")
-        return response.json()
+        '''Fetch available instruments, revalidated by ETag when the API sends one.'''
+        return self.client.get_json("/equity/metadata/instruments",
+        label="/equity/metadata/instruments", conditional=True)
@@ -14,20 +14,16 @@ class PortfolioEndpoints:
 
     def fetch_portfolio(self) -> list[Mapping[str, Any]]:
         '''Fetch current portfolio holdings.'''
-        response = self.client.get("/equity/portfolio", label="/equity/portfolio")
-        return response.json()
+        return self.client.get_json("/equity/portfolio", label="/equity/portfolio")
 
     def fetch_orders(self) -> list[Mapping[str, Any]]:
         '''Fetch current pending orders.'''
-        response = self.client.get("/equity/orders", label="/equity/orders")
-        return response.json()
+        return self.client.get_json("/equity/orders", label="/equity/orders")
 
     def fetch_pies(self) -> list[Mapping[str, Any]]:
         '''Fetch current pies.'''
-        response = self.client.get("/equity/pies", label="/equity/pies")
-        return response.json()
+        return self.client.get_json("/equity/pies", label="/equity/pies")
 
     def fetch_pie_details(self, pie_id: int) -> Mapping[str, Any]:
         '''Fetch details for a specific pie.'''
-        response = self.client.get(f"/equity/pies/{pie_id}", label=f"/equity/pies/{pie_id}")
-        return response.json()
+        return self.client.get_json(f"/equity/pies/{pie_id}", label=f"/equity/pies/{pie_id}")
@@ -0,0 +1,110 @@
+"""Full data pull - fetches ALL data from ALL endpoints and saves to SQL Server.
+
+Installed as the ``t212-pull`` console script. Pass ``--every MINUTES`` to keep
+one warm process (settings, engine pool) running and pull on a fixed interval
+instead of paying interpreter start-up on every scheduler tick. Logs go to
+``./logs`` under the working directory unless ``--log-dir`` says otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .config import Settings, get_settings
+from .logging_config import configure_logging
+from .services.ingestion import IngestionService
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the ``t212-pull`` command-line options."""
+
+    parser = argparse.ArgumentParser(description="Trading212 full data pull")
+    parser.add_argument(
+        "--every",
+        type=float,
+        metavar="MINUTES",
+        help="Keep running and repeat the pull every MINUTES instead of exiting.",
+    )
+    parser.add_argument(
+        "--log-dir",
+        type=Path,
+        default=Path.cwd() / "logs",
+        help="Directory for t212_ingestion.log (default: ./logs).",
+    )
+    return parser.parse_args(argv)
+
+
+def run_pull(service: IngestionService, settings: Settings, log_dir: Path) -> bool:
+    """Run one complete pull, logging the outcome. Returns True on success."""
+
+    # Wall clock for the log line only; the duration comes from the monotonic clock
+    start_time = datetime.now(timezone.utc)
+    start_mono = time.monotonic()
+    logging.info("=" * 80)
+    logging.info("STARTING FULL DATA PULL")
+    logging.info("=" * 80)
+    logging.info("Environment: %s", settings.t212_api_env)
+    logging.info("Database: %s", settings.sqlserver_database)
+    logging.info("Started at: %s", start_time.isoformat())
+    logging.info("=" * 80)
+
+    try:
+        summary = service.run_full_snapshot()
+
+        duration = time.monotonic() - start_mono
+
+        logging.info("=" * 80)
+        logging.info("FULL DATA PULL COMPLETED SUCCESSFULLY")
+        logging.info("=" * 80)
+        logging.info("Duration: %.2f seconds", duration)
+        logging.info("Summary:")
+        for key, value in summary.items():
+            logging.info("  %s: %s", key, value)
+        logging.info("=" * 80)
+
+        print("\n✓ Full data pull completed successfully!")
+        print(f"  Duration: {duration:.2f} seconds")
+        print(f"  Logs saved to: {log_dir / 't212_ingestion.log'}")
+        return True
+
+    except Exception:  # pylint: disable=broad-exception-caught
+        duration = time.monotonic() - start_mono
+
+        logging.error("=" * 80)
+        logging.error("FULL DATA PULL FAILED")
+        logging.error("=" * 80)
+        logging.error("Duration before failure: %.2f seconds", duration)
+        logging.error("=" * 80)
+        logging.exception("Full traceback:")
+
+        print(f"\n✗ Full data pull failed after {duration:.2f} seconds")
+        print(f"  Logs saved to: {log_dir / 't212_ingestion.log'}")
+        return False
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a complete data pull from all Trading 212 endpoints."""
+    args = parse_args(argv)
+    configure_logging(log_dir=args.log_dir)
+
+    settings = get_settings()
+    service = IngestionService(settings=settings)
+
+    if args.every is None:
+        if not run_pull(service, settings, args.log_dir):
+            sys.exit(1)
+        return
+
+    # Scheduler mode: reuse the warm service (settings, engine pool) across pulls
+    interval = args.every * 60
+    while True:
+        started = time.monotonic()
+        run_pull(service, settings, args.log_dir)
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+if __name__ == "__main__":
+    main()
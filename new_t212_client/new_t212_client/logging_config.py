@@ -1,19 +1,44 @@
 """Central logging configuration."""
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+_listener: QueueListener | None = None
+
 
 def configure_logging(log_dir: Path | None = None) -> None:
-    """Set up a basic rotating log handler."""
+    """Set up file + console logging behind a background queue listener.
+
+    Callers only enqueue records; formatting and the file/stderr writes happen
+    on the listener thread, which is flushed and stopped at interpreter exit.
+    """
+
+    global _listener  # pylint: disable=global-statement
+    if _listener is not None or logging.getLogger().handlers:
+        return  # already configured, mirroring logging.basicConfig
 
     target_dir = log_dir or Path.cwd() / "logs"
     target_dir.mkdir(parents=True, exist_ok=True)
     log_file = target_dir / "t212_ingestion.log"
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s %(message)s",
-        handlers=[logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()],
-    )
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Only merge msg % args on the producer side; the listener applies LOG_FORMAT
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+    _listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -4,31 +4,48 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 LOGGER = logging.getLogger(__name__)
 
 
 @dataclass
-class RateLimitState:
-    """Trading212 API rate limit state."""
+class TokenBucket:
+    """Token bucket for a single endpoint, seeded from Trading212 rate-limit headers.
 
-    limit: int
-    period: int
-    remaining: int
-    reset_epoch: int
+    ``tokens`` may go negative: each unit below zero is a caller already queued.
+    """
+
+    capacity: int
+    refill_per_sec: float
+    tokens: float
+    last_refill: float
+    reset_epoch: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def refill(self, now: float) -> None:
+        """Top the bucket up with the tokens accrued since the last refill."""
+
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_sec)
+            self.last_refill = now
 
 
 class RateLimiter:
-    """Simple cooperative rate limiter."""
+    """Cooperative per-endpoint token-bucket rate limiter.
+
+    There is no global lock: buckets are registered with an atomic
+    ``dict.setdefault`` and each bucket's lock is held only for a few
+    arithmetic operations. Callers reserve a token up front (a negative
+    balance means queued callers) and sleep outside the lock.
+    """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._state: dict[str, RateLimitState] = {}
-        self._first_calls: set[str] = set()  # Track first calls to avoid unnecessary waits
+        self._buckets: dict[str, TokenBucket] = {}
 
     def update_from_headers(self, endpoint: str, headers: dict[str, str]) -> None:
-        """Refresh in-memory state after each response."""
+        """Refresh the endpoint bucket from the latest response headers."""
 
         limit = headers.get("x-ratelimit-limit")
         period = headers.get("x-ratelimit-period")
@@ -36,50 +53,56 @@ class RateLimiter:
         reset_epoch = headers.get("x-ratelimit-reset")
         if not all((limit, period, remaining, reset_epoch)):
             return
-        with self._lock:
-            self._state[endpoint] = RateLimitState(
-                limit=int(limit),
-                period=int(period),
-                remaining=int(remaining),
-                reset_epoch=int(reset_epoch),
-            )
 
-    def wait(self, endpoint: str) -> None:
-        """Sleep if the recorded state suggests the bucket is empty."""
-
-        with self._lock:
-            state = self._state.get(endpoint)
-            is_first_call = endpoint not in self._first_calls
-            self._first_calls.add(endpoint)
-
-        if not state:
-            # No rate limit info yet - only wait for history endpoints on subsequent calls
-            if 'history' in endpoint and not is_first_call:
-                LOGGER.info(
-                    "  ⏸ No rate limit info for %s - waiting 10 seconds (conservative)",
-                    endpoint,
-                )
-                time.sleep(10)
+        capacity = int(limit)
+        refill_per_sec = capacity / max(int(period), 1)
+        now = time.monotonic()
+        seeded = TokenBucket(
+            capacity=capacity,
+            refill_per_sec=refill_per_sec,
+            tokens=float(remaining),
+            last_refill=now,
+            reset_epoch=int(reset_epoch),
+        )
+        bucket = self._buckets.setdefault(endpoint, seeded)
+        if bucket is seeded:
             return
 
-        # If we have remaining requests, check if we need to pace ourselves
-        if state.remaining > 0:
-            # For history endpoints with 6 req/min limit, wait 10 seconds between calls
-            if 'history' in endpoint and state.limit == 6:
-                LOGGER.info("  ⏸ Pacing requests for %s - waiting 10 seconds", endpoint)
-                time.sleep(10)
+        with bucket.lock:
+            bucket.refill(now)
+            bucket.capacity = capacity
+            bucket.refill_per_sec = refill_per_sec
+            # Keep outstanding reservations: never raise the balance above our estimate
+            bucket.tokens = min(bucket.tokens, float(remaining))
+            bucket.reset_epoch = int(reset_epoch)
+
+    def wait(self, endpoint: str) -> None:
+        """Reserve a token for ``endpoint``, sleeping exactly as long as the bucket requires."""
+
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            # No rate limit info yet - the first response will seed the bucket
             return
 
-        # Bucket is empty, wait until reset
-        wait_seconds = max(0, state.reset_epoch - int(time.time()))
-        if wait_seconds > 0:
-            LOGGER.info(
-                "  ⏸ Rate limit reached for %s - waiting %d seconds...",
-                endpoint,
-                wait_seconds,
-            )
-            time.sleep(wait_seconds)
-            LOGGER.info("  ▶ Resuming requests to %s", endpoint)
+        with bucket.lock:
+            bucket.refill(time.monotonic())
+            server_exhausted = bucket.tokens <= 0
+            bucket.tokens -= 1
+            if bucket.tokens >= 0:
+                return
+            wait_seconds = -bucket.tokens / bucket.refill_per_sec
+            reset_epoch = bucket.reset_epoch
+
+        if server_exhausted:
+            # Bucket reported empty - never resume before the server's reset time
+            wait_seconds = max(wait_seconds, reset_epoch - time.time())
+        LOGGER.info(
+            "  ⏸ Rate limit reached for %s - waiting %.1f seconds...",
+            endpoint,
+            wait_seconds,
+        )
+        time.sleep(wait_seconds)
+        LOGGER.info("  ▶ Resuming requests to %s", endpoint)
 
 
 rate_limiter = RateLimiter()
@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any, Dict, List
 
-from sqlalchemy import text
-
 from ..client import T212Client
 from ..config import Settings, get_settings
 from ..endpoints.account import AccountEndpoints
@@ -23,17 +23,25 @@ from ..transformers import (
 
 LOGGER = logging.getLogger(__name__)
 
+_TRANSACTION_KEY = itemgetter("reference", "type")
+
 
 class IncrementalCollectionService:
     """Collect current snapshots + only NEW historical data."""
 
+    SNAPSHOT_WORKERS = 3  # cash, portfolio and pending orders run side by side
+    RECENT_TRANSACTION_KEYS = 500  # dedup window loaded from the DB each run
+
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
         self.engine = create_sql_engine(self.settings)
-        self.repository = SqlServerRepository(self.engine)
+        self.repository = SqlServerRepository(
+            self.engine, batch_size=self.settings.sqlserver_bulk_batch_size
+        )
 
     def run(self) -> Dict[str, Any]:
         """Execute incremental collection."""
+        # One timestamp for every row written by this run
         collection_time = datetime.now(timezone.utc)
 
         with T212Client(self.settings) as client:
@@ -42,13 +50,25 @@ class IncrementalCollectionService:
             account_info = account_endpoints.fetch_info()
             account_id, _ = extract_account_identity(account_info)
 
-            # Snapshots (always full refresh)
-            cash_count = self._collect_cash_snapshot(account_endpoints, account_id, collection_time)
-            portfolio_count = self._collect_portfolio_snapshot(client, account_id, collection_time)
-            orders_count = self._collect_pending_orders(client, account_id, collection_time)
+            # Snapshots (always full refresh) - independent endpoints, fetched concurrently
+            with ThreadPoolExecutor(max_workers=self.SNAPSHOT_WORKERS) as executor:
+                cash_future = executor.submit(
+                    self._collect_cash_snapshot, account_endpoints, account_id, collection_time
+                )
+                portfolio_future = executor.submit(
+                    self._collect_portfolio_snapshot, client, account_id, collection_time
+                )
+                orders_future = executor.submit(
+                    self._collect_pending_orders, client, account_id, collection_time
+                )
+                cash_count = cash_future.result()
+                portfolio_count = portfolio_future.result()
+                orders_count = orders_future.result()
 
             # Incremental history
-            transaction_count = self._collect_new_transactions(client, account_id)
+            transaction_count = self._collect_new_transactions(
+                client, account_id, collection_time
+            )
 
         return {
             "account_id": account_id,
@@ -115,20 +135,21 @@ class IncrementalCollectionService:
         LOGGER.info("✓ No pending orders")
         return 0
 
-    def _collect_new_transactions(self, client: T212Client, account_id: int) -> int:
+    def _collect_new_transactions(
+        self, client: T212Client, account_id: int, collection_time: datetime
+    ) -> int:
         """Collect only NEW transactions since last collection."""
         LOGGER.info("[4/4] Collecting NEW transactions (incremental)...")
 
-        # Get existing transaction references from DB
-        with self.engine.begin() as conn:
-            result = conn.execute(
-                text("SELECT reference, transaction_type FROM core.transaction_history")
-            ).fetchall()
-
-        existing_refs = {(row[0], row[1]) for row in result} if result else set()
+        # Only the most recent keys are needed: the API returns newest-first and
+        # pagination stops at the first page without new rows. Anything older that
+        # slips through is filtered server-side by insert_transaction_history.
+        existing_refs = self.repository.fetch_recent_transaction_keys(
+            account_id, limit=self.RECENT_TRANSACTION_KEYS
+        )
 
         if existing_refs:
-            LOGGER.info("Found %d existing transactions in DB", len(existing_refs))
+            LOGGER.info("Loaded %d recent transaction keys from DB", len(existing_refs))
         else:
             LOGGER.info("No transactions in DB - will collect recent transactions")
 
@@ -137,10 +158,10 @@ class IncrementalCollectionService:
         new_transactions = self._fetch_new_transactions(history_endpoints, existing_refs)
 
         if new_transactions:
-            rows = build_transaction_rows(account_id, new_transactions)
-            self.repository.insert_transaction_history(rows)
-            LOGGER.info("✓ New transactions: %d", len(rows))
-            return len(rows)
+            rows = build_transaction_rows(account_id, new_transactions, collection_time)
+            inserted = self.repository.insert_transaction_history(rows)
+            LOGGER.info("✓ New transactions: %d", inserted)
+            return inserted
 
         LOGGER.info("✓ No new transactions")
         return 0
@@ -150,54 +171,83 @@ class IncrementalCollectionService:
         history_endpoints: HistoryEndpoints,
         existing_refs: set
     ) -> List[Dict[str, Any]]:
-        """Paginate through transactions, skip ones already in DB."""
+        """Paginate through transactions, skip ones already in DB.
+
+        The next page is requested in the background as soon as the current
+        page is known to contain new rows, so it downloads while this page is
+        collected. A page with nothing new ends pagination without a request
+        (and its rate-limit token) already in flight.
+        """
         new_transactions = []
-        params = {"limit": 50}
+        params: Dict[str, Any] = {"limit": 50}
         page = 1
         max_pages = 5  # Rate limit safety
 
-        while page <= max_pages:
-            LOGGER.info("  Fetching page %d...", page)
-            response = history_endpoints.fetch_transactions(params=params)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(history_endpoints.fetch_transactions, params=dict(params))
+
+            while page <= max_pages:
+                LOGGER.debug("  Fetching page %d...", page)
+                response = pending.result()
+                pending = None
+
+                if not response or not response.get('items'):
+                    LOGGER.info("  No more data")
+                    break
 
-            if not response or not response.get('items'):
-                LOGGER.info("  No more data")
-                break
+                page_items = response['items']
 
-            page_items = response['items']
-            LOGGER.info("  Page %d: %d items", page, len(page_items))
+                next_params = self._next_page_params(response.get('nextPagePath'), params)
 
-            # Filter out duplicates by checking (reference, type) combination
-            new_count = 0
-            for tx in page_items:
-                ref = tx.get('reference')
-                tx_type = tx.get('type')
+                # Filter out duplicates by (reference, type) with one set operation per page
+                try:
+                    keys = list(map(_TRANSACTION_KEY, page_items))
+                except KeyError:  # tolerate items missing a field, as .get() did
+                    keys = [(tx.get('reference'), tx.get('type')) for tx in page_items]
+                new_keys = set(keys)
+                new_keys.difference_update(existing_refs)
+                existing_refs.update(new_keys)  # Track to avoid dupes in same fetch
 
-                if (ref, tx_type) not in existing_refs:
-                    new_transactions.append(tx)
-                    existing_refs.add((ref, tx_type))  # Track to avoid dupes in same fetch
-                    new_count += 1
+                # Only a page with new rows continues, so only then fetch the next one
+                if new_keys and next_params is not None and page < max_pages:
+                    pending = executor.submit(
+                        history_endpoints.fetch_transactions, params=next_params
+                    )
 
-            LOGGER.info("  Found %d new transactions on this page", new_count)
+                new_count = 0
+                if new_keys:
+                    for tx, key in zip(page_items, keys):
+                        if key in new_keys:
+                            new_keys.discard(key)  # first occurrence on the page wins
+                            new_transactions.append(tx)
+                            new_count += 1
 
-            # If no new transactions on this page, likely all caught up
-            if new_count == 0:
-                LOGGER.info("  No new transactions found - stopping pagination")
-                break
+                LOGGER.info("  Page %d: %d items, %d new", page, len(page_items), new_count)
 
-            # Check for next page
-            next_page = response.get('nextPagePath')
-            if not next_page:
-                break
+                # If no new transactions on this page, likely all caught up
+                if new_count == 0:
+                    LOGGER.info("  No new transactions found - stopping pagination")
+                    break
 
-            # Parse next page cursor
-            if '?cursor=' in next_page:
-                cursor = next_page.split('?cursor=')[1].split('&')[0]
-                params['cursor'] = cursor
+                # Check for next page
+                if next_params is None:
+                    break
 
-            page += 1
+                params = next_params
+                page += 1
 
         if page > max_pages:
             LOGGER.warning("  Hit page limit - will continue next run")
 
         return new_transactions
+
+    @staticmethod
+    def _next_page_params(
+        next_page: str | None, params: Dict[str, Any]
+    ) -> Dict[str, Any] | None:
+        """Derive the request params for ``nextPagePath``, or None on the last page."""
+
+        if not next_page or '?cursor=' not in next_page:
+            return None
+        cursor = next_page.split('?cursor=')[1].split('&')[0]
+        return {**params, 'cursor': cursor}
@@ -2,12 +2,19 @@
 from __future__ import annotations
 
 import logging
+import os
+import queue
+import threading
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Tuple
-from urllib.parse import parse_qsl, urlparse
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Tuple
+from urllib.parse import parse_qsl, unquote_plus, urlparse
 
+import httpx
 from tqdm import tqdm
 
 from ..client import T212Client
@@ -22,15 +29,67 @@ from ..transformers import (
     build_dividend_rows,
     build_exchange_rows,
     build_instrument_rows,
-    build_order_history_items,
     build_pending_order_rows,
     build_portfolio_rows,
     build_transaction_rows,
     extract_account_identity,
+    iter_order_history_items,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+_ORDER_KEY = itemgetter("order_id", "fill_id")
+
+
+class Page(NamedTuple):
+    """Items and continuation cursor of one paginated API response."""
+
+    items: List[Mapping[str, Any]]
+    next_path: str | None
+
+
+def read_page(payload: Mapping[str, Any]) -> Page:
+    """Unpack a paginated payload with one lookup per field."""
+    return Page(payload.get("items") or [], payload.get("nextPagePath"))
+
+
+@lru_cache(maxsize=64)
+def _format_endpoint(relative_path: str) -> str:
+    """Return the ``/api/v0/...`` label for a relative path; memoized per path."""
+    trimmed = relative_path.lstrip("/")
+    if not trimmed.startswith("api/v0/"):
+        trimmed = f"api/v0/{trimmed}"
+    return f"/{trimmed}"
+
+
+@lru_cache(maxsize=256)
+def _split_next_path(next_page_path: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Split a `nextPagePath` into its API-relative path and query pairs.
+
+    Query-only cursors (``?cursor=..`` or a bare ``cursor=..``) yield an empty
+    path, meaning "same endpoint".
+    """
+    if next_page_path.startswith(("http://", "https://")):
+        parsed = urlparse(next_page_path)
+        relative_path = parsed.path
+        query_pairs = tuple(parse_qsl(parsed.query))
+    else:
+        # Relative cursors are all the API sends; skip the full URL parser for them
+        if not next_page_path.startswith(("/", "?")):
+            next_page_path = f"?{next_page_path}"
+        relative_path, _, query = next_page_path.partition("?")
+        # Same result as parse_qsl: blank and key-only fields are dropped
+        query_pairs = tuple(
+            (unquote_plus(key), unquote_plus(value))
+            for key, sep, value in (field.partition("=") for field in query.split("&"))
+            if sep and value
+        )
+
+    relative_path = relative_path.lstrip("/")
+    if relative_path.startswith("api/v0/"):
+        relative_path = relative_path[len("api/v0/") :]
+    return relative_path, query_pairs
+
 
 @dataclass
 class IngestionSummary:
@@ -65,13 +124,95 @@ class IngestionSummary:
         }
 
 
+class RawPayloadWriter:
+    """Write raw API payloads to staging on a single background thread.
+
+    Callers enqueue a payload and carry on with the next request, so the
+    staging insert overlaps the following HTTP round-trip. Whatever has queued
+    up while the previous insert ran is flushed as one batch, so batches grow
+    only when the database falls behind. The capture time is fixed at submit
+    time; the first write error is re-raised from ``close``.
+    """
+
+    QUEUE_SIZE = 32  # bounds memory if the database falls behind the API
+
+    def __init__(self, repository: SqlServerRepository) -> None:
+        self._repository = repository
+        self._queue: queue.Queue[Dict[str, Any] | None] = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, name="raw-payload-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "RawPayloadWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass  # already logged; don't mask the original error
+
+    def submit(
+        self,
+        endpoint: str,
+        payload: Any,
+        *,
+        account_id: int | None = None,
+        correlation_id: str | None = None,
+    ) -> datetime:
+        """Queue a payload for staging and return its capture timestamp."""
+        captured_at = datetime.now(timezone.utc)
+        self._queue.put(
+            {
+                "endpoint": endpoint,
+                "payload": payload,
+                "account_id": account_id,
+                "correlation_id": correlation_id,
+                "captured_at": captured_at,
+            }
+        )
+        return captured_at
+
+    def close(self) -> None:
+        """Flush queued payloads and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.QUEUE_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                stopping = True
+                batch.pop()
+            if not batch or self._error is not None:
+                continue  # keep draining so producers never block on a full queue
+            try:
+                self._repository.record_raw_payloads(batch)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                LOGGER.error("Failed to stage %d raw payload(s): %s", len(batch), exc)
+                self._error = exc
+
+
 class IngestionService:
     """Coordinate API calls, transformations, and persistence."""
 
     # Configuration constants
     PAGE_LIMIT = 50
-    HISTORY_RATE_LIMIT_DELAY = 12  # seconds between history API calls
+    HISTORY_RATE_LIMIT_DELAY = 10.5  # seconds between history request starts (6 req/min + slack)
     RATE_LIMIT_RETRY_DELAY = 30  # seconds to wait after 429 error
+    HISTORY_WORKERS = 3  # orders, dividends and transactions paginate in parallel
+    SNAPSHOT_WORKERS = 2  # cash and portfolio snapshots, exchanges and instruments
 
     def __init__(
         self,
@@ -81,7 +222,10 @@ class IngestionService:
     ) -> None:
         self.settings = settings or get_settings()
         self.engine = repository.engine if repository else create_sql_engine(self.settings)
-        self.repository = repository or SqlServerRepository(self.engine)
+        self.repository = repository or SqlServerRepository(
+            self.engine, batch_size=self.settings.sqlserver_bulk_batch_size
+        )
+        self._raw_writer: RawPayloadWriter | None = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -89,21 +233,44 @@ class IngestionService:
     def run_full_snapshot(self) -> Dict[str, Any]:
         """Execute the full pull of current state and history snapshots."""
         summary = IngestionSummary()
-        correlation_id = uuid.uuid4().hex
-
-        with T212Client(self.settings) as client:
-            account_id = self._ingest_account_state(client, summary, correlation_id)
-            if account_id is None:
-                raise RuntimeError(
-                    "Account information could not be retrieved; aborting ingestion."
-                )
-
-            self._ingest_portfolio_state(client, summary, account_id, correlation_id)
-            self._ingest_history(client, summary, account_id, correlation_id)
-            self._ingest_metadata(client, summary, correlation_id)
-
-        LOGGER.info("Ingestion summary: %s", summary.as_dict())
-        return summary.as_dict()
+        correlation_id = os.urandom(16).hex()
+
+        try:
+            with T212Client(self.settings) as client, RawPayloadWriter(self.repository) as raw_writer:
+                self._raw_writer = raw_writer
+                account_id = self._ingest_account_state(client, summary, correlation_id)
+                if account_id is None:
+                    raise RuntimeError(
+                        "Account information could not be retrieved; aborting ingestion."
+                    )
+
+                # Metadata depends on nothing account-specific: run it in the background
+                # so it hides behind the rate-limited history pagination.
+                with ThreadPoolExecutor(max_workers=1) as metadata_executor:
+                    metadata_future = metadata_executor.submit(
+                        self._ingest_metadata, client, summary, correlation_id
+                    )
+
+                    # Cash and portfolio endpoints have separate rate-limit buckets
+                    with ThreadPoolExecutor(max_workers=self.SNAPSHOT_WORKERS) as executor:
+                        cash_future = executor.submit(
+                            self._ingest_cash_snapshot, client, summary, account_id, correlation_id
+                        )
+                        portfolio_future = executor.submit(
+                            self._ingest_portfolio_state, client, summary, account_id, correlation_id
+                        )
+                        cash_future.result()
+                        portfolio_future.result()
+
+                    self._ingest_history(client, summary, account_id, correlation_id)
+                    metadata_future.result()
+        finally:
+            # Never keep a closed writer around if a stage raised
+            self._raw_writer = None
+
+        result = summary.as_dict()
+        LOGGER.info("Ingestion summary: %s", result)
+        return result
 
     # ------------------------------------------------------------------
     # Account state
@@ -123,7 +290,7 @@ class IngestionService:
             return None
 
         account_endpoint = self._format_endpoint("equity/account/info")
-        info_captured_at = self.repository.record_raw_payload(
+        info_captured_at = self._raw_writer.submit(
             account_endpoint,
             account_payload,
             correlation_id=correlation_id,
@@ -132,11 +299,19 @@ class IngestionService:
         summary.account_id = account_id
         self.repository.upsert_account_profile(account_id, currency_code, info_captured_at)
         LOGGER.info("Account %d (%s) profile updated", account_id, currency_code)
+        return account_id
 
+    def _ingest_cash_snapshot(
+        self,
+        client: T212Client,
+        summary: IngestionSummary,
+        account_id: int,
+        correlation_id: str,
+    ) -> None:
         LOGGER.info("Fetching account cash balance...")
-        cash_payload = account_endpoints.fetch_cash()
+        cash_payload = AccountEndpoints(client).fetch_cash()
         cash_endpoint = self._format_endpoint("equity/account/cash")
-        cash_captured_at = self.repository.record_raw_payload(
+        cash_captured_at = self._raw_writer.submit(
             cash_endpoint,
             cash_payload,
             account_id=account_id,
@@ -151,7 +326,6 @@ class IngestionService:
             cash_row.get("free_amount", 0),
             cash_row.get("invested_amount", 0),
         )
-        return account_id
 
     # ------------------------------------------------------------------
     # Portfolio snapshot
@@ -168,7 +342,7 @@ class IngestionService:
 
         positions_payload = portfolio_endpoints.fetch_portfolio() or []
         portfolio_endpoint = self._format_endpoint("equity/portfolio")
-        portfolio_captured_at = self.repository.record_raw_payload(
+        portfolio_captured_at = self._raw_writer.submit(
             portfolio_endpoint,
             positions_payload,
             account_id=account_id,
@@ -185,7 +359,7 @@ class IngestionService:
         LOGGER.info("Fetching pending orders...")
         orders_payload = portfolio_endpoints.fetch_orders() or []
         orders_endpoint = self._format_endpoint("equity/orders")
-        orders_captured_at = self.repository.record_raw_payload(
+        orders_captured_at = self._raw_writer.submit(
             orders_endpoint,
             orders_payload,
             account_id=account_id,
@@ -212,93 +386,90 @@ class IngestionService:
         LOGGER.info("HISTORICAL DATA INGESTION (Account %d)", account_id)
         history_endpoints = HistoryEndpoints(client)
 
-        # Historical orders
-        LOGGER.info("[1/3] Historical Orders - Starting pagination...")
-        orders = self._collect_paginated_items(
-            client,
-            base_path="equity/history/orders",
-            first_page_loader=lambda: history_endpoints.fetch_orders(
-                params={"limit": self.PAGE_LIMIT}
-            ),
-            account_id=account_id,
-            correlation_id=correlation_id,
-        )
-        LOGGER.info("[1/3] Fetched %d historical orders", len(orders))
-
-        if orders:
-            LOGGER.info("[1/3] Transforming and inserting orders...")
-            order_bundles = build_order_history_items(account_id, orders)
-            inserted_count = 0
-            duplicate_count = 0
-
-            with tqdm(
-                total=len(order_bundles),
-                desc="  Inserting orders",
-                unit="order",
-                leave=False,
-            ) as pbar:
-                for bundle in order_bundles:
-                    try:
-                        self.repository.insert_order_history(bundle.order, bundle.taxes)
-                        inserted_count += 1
-                    except Exception as e:  # pylint: disable=broad-exception-caught
-                        if "duplicate" in str(e).lower() or "unique" in str(e).lower():
-                            duplicate_count += 1
-                        else:
-                            LOGGER.error(
-                                "  Failed to insert order %s: %s",
-                                bundle.order.get("order_id"),
-                                str(e),
-                            )
-                    pbar.update(1)
-
-            summary.order_history_rows = inserted_count
+        # One fallback timestamp for the whole run, shared by every history page
+        collected_at = datetime.now(timezone.utc)
+
+        # The three history streams have independent rate-limit buckets, so they
+        # are paginated concurrently: wall time is the slowest stream, not the sum.
+        # Each page is transformed and written as it arrives, so memory is bounded
+        # by the page size rather than the length of the account history.
+        LOGGER.info("Paginating orders, dividends and transactions concurrently...")
+        with ThreadPoolExecutor(max_workers=self.HISTORY_WORKERS) as executor:
+            orders_future = executor.submit(
+                self._collect_paginated_items,
+                client,
+                base_path="equity/history/orders",
+                first_page_loader=lambda: history_endpoints.fetch_orders(
+                    params={"limit": self.PAGE_LIMIT}
+                ),
+                sink=partial(self._insert_order_page, account_id),
+                account_id=account_id,
+                correlation_id=correlation_id,
+            )
+            dividends_future = executor.submit(
+                self._collect_paginated_items,
+                client,
+                base_path="history/dividends",
+                first_page_loader=lambda: history_endpoints.fetch_dividends(
+                    params={"limit": self.PAGE_LIMIT}
+                ),
+                sink=lambda items: self.repository.insert_dividend_history(
+                    build_dividend_rows(account_id, items, collected_at)
+                ),
+                account_id=account_id,
+                correlation_id=correlation_id,
+            )
+            transactions_future = executor.submit(
+                self._collect_paginated_items,
+                client,
+                base_path="history/transactions",
+                first_page_loader=lambda: history_endpoints.fetch_transactions(
+                    params={"limit": self.PAGE_LIMIT}
+                ),
+                sink=lambda items: self.repository.insert_transaction_history(
+                    build_transaction_rows(account_id, items, collected_at)
+                ),
+                account_id=account_id,
+                correlation_id=correlation_id,
+            )
+            order_count, summary.order_history_rows = orders_future.result()
+            dividend_count, summary.dividend_rows = dividends_future.result()
+            transaction_count, summary.transaction_rows = transactions_future.result()
+
+        LOGGER.info("[1/3] Fetched %d historical orders", order_count)
+        if order_count:
             LOGGER.info(
                 "[1/3] Inserted %d new orders, skipped %d duplicates",
-                inserted_count,
-                duplicate_count,
+                summary.order_history_rows,
+                order_count - summary.order_history_rows,
             )
 
-        # Dividends
-        LOGGER.info("[2/3] Dividend History - Starting pagination...")
-        dividends = self._collect_paginated_items(
-            client,
-            base_path="history/dividends",
-            first_page_loader=lambda: history_endpoints.fetch_dividends(
-                params={"limit": self.PAGE_LIMIT}
-            ),
-            account_id=account_id,
-            correlation_id=correlation_id,
-        )
-        LOGGER.info("[2/3] Fetched %d dividend records", len(dividends))
-
-        dividend_rows = build_dividend_rows(account_id, dividends)
-        if dividend_rows:
-            self.repository.insert_dividend_history(dividend_rows)
-            summary.dividend_rows = len(dividend_rows)
-            LOGGER.info("[2/3] Inserted %d dividend records", len(dividend_rows))
-
-        # Transactions
-        LOGGER.info("[3/3] Transaction History - Starting pagination...")
-        transactions = self._collect_paginated_items(
-            client,
-            base_path="history/transactions",
-            first_page_loader=lambda: history_endpoints.fetch_transactions(
-                params={"limit": self.PAGE_LIMIT}
-            ),
-            account_id=account_id,
-            correlation_id=correlation_id,
-        )
-        LOGGER.info("[3/3] Fetched %d transaction records", len(transactions))
+        LOGGER.info("[2/3] Fetched %d dividend records", dividend_count)
+        if dividend_count:
+            LOGGER.info("[2/3] Inserted %d dividend records", summary.dividend_rows)
 
-        transaction_rows = build_transaction_rows(account_id, transactions)
-        if transaction_rows:
-            self.repository.insert_transaction_history(transaction_rows)
-            summary.transaction_rows = len(transaction_rows)
-            LOGGER.info("[3/3] Inserted %d transaction records", len(transaction_rows))
+        LOGGER.info("[3/3] Fetched %d transaction records", transaction_count)
+        if transaction_count:
+            LOGGER.info("[3/3] Inserted %d transaction records", summary.transaction_rows)
 
         LOGGER.info("Historical data ingestion complete")
 
+    def _insert_order_page(
+        self,
+        account_id: int,
+        page_items: List[Mapping[str, Any]],
+    ) -> int:
+        """Transform one page of historical orders and insert those not yet stored."""
+        bundles = list(iter_order_history_items(account_id, page_items))
+        # One round-trip for this page's stored keys, so reruns only ship new orders
+        existing_keys = self.repository.fetch_order_history_keys(
+            account_id, (bundle.order["order_id"] for bundle in bundles)
+        )
+        new_bundles = [
+            bundle for bundle in bundles if _ORDER_KEY(bundle.order) not in existing_keys
+        ]
+        return self.repository.insert_order_history_batch(new_bundles) if new_bundles else 0
+
     # ------------------------------------------------------------------
     # Metadata
     # ------------------------------------------------------------------
@@ -311,11 +482,17 @@ class IngestionService:
         LOGGER.info("METADATA INGESTION")
         metadata_endpoints = MetadataEndpoints(client)
 
+        # Exchanges and instruments are independent - fetch both at once
+        LOGGER.info("Fetching exchanges and tradable instruments...")
+        with ThreadPoolExecutor(max_workers=self.SNAPSHOT_WORKERS) as executor:
+            exchanges_future = executor.submit(metadata_endpoints.fetch_exchanges)
+            instruments_future = executor.submit(metadata_endpoints.fetch_instruments)
+            exchanges_payload = exchanges_future.result() or []
+            instruments_payload = instruments_future.result() or []
+
         # Exchanges
-        LOGGER.info("[1/2] Fetching exchanges and working schedules...")
-        exchanges_payload = metadata_endpoints.fetch_exchanges() or []
         exchanges_endpoint = self._format_endpoint("equity/metadata/exchanges")
-        self.repository.record_raw_payload(
+        self._raw_writer.submit(
             exchanges_endpoint,
             exchanges_payload,
             correlation_id=correlation_id,
@@ -335,10 +512,8 @@ class IngestionService:
             )
 
         # Instruments
-        LOGGER.info("[2/2] Fetching tradable instruments...")
-        instruments_payload = metadata_endpoints.fetch_instruments() or []
         instruments_endpoint = self._format_endpoint("equity/metadata/instruments")
-        self.repository.record_raw_payload(
+        self._raw_writer.submit(
             instruments_endpoint,
             instruments_payload,
             correlation_id=correlation_id,
@@ -356,6 +531,24 @@ class IngestionService:
     # Pagination helpers
     # ------------------------------------------------------------------
     def _collect_paginated_items(
+        self,
+        client: T212Client,
+        *,
+        sink: Callable[[List[Mapping[str, Any]]], int],
+        **page_kwargs: Any,
+    ) -> Tuple[int, int]:
+        """Stream every page of a paginated response into ``sink``.
+
+        Returns ``(items_fetched, rows_written)``, summing the sink's results.
+        """
+        fetched = written = 0
+        for page_items in self._iter_pages(client, **page_kwargs):
+            fetched += len(page_items)
+            if page_items:
+                written += sink(page_items)
+        return fetched, written
+
+    def _iter_pages(
         self,
         client: T212Client,
         *,
@@ -363,126 +556,158 @@ class IngestionService:
         first_page_loader,
         account_id: int,
         correlation_id: str,
-    ) -> List[Mapping[str, Any]]:
-        """Fetch all pages for a paginated response."""
-        collected: List[Mapping[str, Any]] = []
+    ) -> Iterator[List[Mapping[str, Any]]]:
+        """Yield the items of each page of a paginated response as it arrives."""
+        item_count = 0
         endpoint_label = self._format_endpoint(base_path)
+        is_transactions = "transactions" in base_path
 
         # Fetch first page
+        last_started = time.monotonic()
         first_payload = first_page_loader()
-        self.repository.record_raw_payload(
+        self._raw_writer.submit(
             endpoint_label,
             first_payload,
             account_id=account_id,
             correlation_id=correlation_id,
         )
-        page_items = first_payload.get("items", [])
-        collected.extend(page_items)
-        next_path = first_payload.get("nextPagePath")
+        page_items, next_path = read_page(first_payload)
+        item_count += len(page_items)
+        yield page_items
 
         if not next_path:
-            LOGGER.info("  Retrieved %d items (single page)", len(collected))
-            return collected
-
-        # Multiple pages
+            LOGGER.info("  Retrieved %d items (single page)", item_count)
+            return
+
+        # Multiple pages: as soon as a page reveals the next cursor, the request
+        # for it is handed to a prefetch worker, so staging and accumulating the
+        # current page overlap the rate-limit wait and the next round-trip.
+        # The history delay is measured between request starts, not loop turns.
+        delay = self.HISTORY_RATE_LIMIT_DELAY if "history" in base_path else 0
         page_num = 1
-        seen_cursors = {next_path}
+        # Cursor-loop detection keeps 64-bit hashes, not the full cursor paths
+        seen_cursors = {hash(next_path)}
         pbar = tqdm(
             desc=f"  Paginating {base_path}",
             unit="page",
             initial=1,
             bar_format="{desc}: {n} pages | {rate_fmt}",
             leave=False,
+            mininterval=1.0,
+            disable=None,  # no-op when stderr is not a TTY (scheduler / log capture)
         )
 
-        while next_path:
-            page_num += 1
-
-            # Rate limiting for history endpoints
-            if "history" in base_path:
-                time.sleep(self.HISTORY_RATE_LIMIT_DELAY)
-
-            request_path, params = self._normalise_next_page_path(base_path, next_path)
-
-            try:
-                response = client.get(request_path, params=params, label=endpoint_label)
-                page_payload = response.json()
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                error_str = str(e).lower()
-
-                if "429" in error_str or "too many requests" in error_str:
-                    LOGGER.warning("  Rate limit hit! Waiting %ds...", self.RATE_LIMIT_RETRY_DELAY)
-                    time.sleep(self.RATE_LIMIT_RETRY_DELAY)
-                    continue
-
-                if "transactions" in base_path and ("400" in error_str or "404" in error_str):
-                    LOGGER.info("  End of transaction data reached")
-                    pbar.close()
-                    break
-
-                LOGGER.error("  Failed to fetch page %d: %s", page_num, str(e))
-                LOGGER.warning("  Stopping pagination. Collected %d items so far.", len(collected))
-                pbar.close()
-                break
-
-            self.repository.record_raw_payload(
-                endpoint_label,
-                page_payload,
-                account_id=account_id,
-                correlation_id=correlation_id,
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(
+                self._fetch_page,
+                client,
+                base_path,
+                next_path,
+                endpoint_label=endpoint_label,
+                is_transactions=is_transactions,
+                not_before=last_started + delay,
             )
-            page_items = page_payload.get("items", [])
-            collected.extend(page_items)
-            next_path = page_payload.get("nextPagePath")
-
-            # Detect cursor loops
-            if next_path:
-                if next_path in seen_cursors:
-                    LOGGER.warning("  Pagination loop detected. Stopping.")
-                    pbar.close()
+
+            while pending is not None:
+                page_num += 1
+                try:
+                    page_payload, last_started = pending.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    status = (
+                        e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                    )
+
+                    if status == 429:
+                        LOGGER.warning("  Rate limit hit! Waiting %ds...", self.RATE_LIMIT_RETRY_DELAY)
+                        pending = prefetcher.submit(
+                            self._fetch_page,
+                            client,
+                            base_path,
+                            next_path,
+                            endpoint_label=endpoint_label,
+                            is_transactions=is_transactions,
+                            not_before=time.monotonic() + self.RATE_LIMIT_RETRY_DELAY,
+                        )
+                        continue
+
+                    if is_transactions and status in (400, 404):
+                        LOGGER.info("  End of transaction data reached")
+                        break
+
+                    LOGGER.error("  Failed to fetch page %d: %s", page_num, str(e))
+                    LOGGER.warning("  Stopping pagination. Collected %d items so far.", item_count)
                     break
-                seen_cursors.add(next_path)
 
-            pbar.update(1)
+                page_items, next_path = read_page(page_payload)
+                pending = None
+                if next_path:
+                    # Detect cursor loops before requesting the next page
+                    cursor_hash = hash(next_path)
+                    if cursor_hash in seen_cursors:
+                        LOGGER.warning("  Pagination loop detected. Stopping.")
+                    else:
+                        seen_cursors.add(cursor_hash)
+                        pending = prefetcher.submit(
+                            self._fetch_page,
+                            client,
+                            base_path,
+                            next_path,
+                            endpoint_label=endpoint_label,
+                            is_transactions=is_transactions,
+                            not_before=last_started + delay,
+                        )
+
+                self._raw_writer.submit(
+                    endpoint_label,
+                    page_payload,
+                    account_id=account_id,
+                    correlation_id=correlation_id,
+                )
+                item_count += len(page_items)
+                pbar.update(1)
+                yield page_items
 
         pbar.close()
-        LOGGER.info("  Pagination complete: %d pages, %d total items", page_num, len(collected))
-        return collected
+        LOGGER.info("  Pagination complete: %d pages, %d total items", page_num, item_count)
 
-    def _normalise_next_page_path(
+    def _fetch_page(
         self,
+        client: T212Client,
+        base_path: str,
+        next_path: str,
+        *,
+        endpoint_label: str,
+        is_transactions: bool,
+        not_before: float,
+    ) -> Tuple[Mapping[str, Any], float]:
+        """Fetch one cursor page once the monotonic ``not_before`` has passed.
+
+        Returns the decoded payload and the monotonic time the request started.
+        """
+        time.sleep(max(0.0, not_before - time.monotonic()))
+        started = time.monotonic()
+        request_path, params = self._normalise_next_page_path(
+            base_path, next_path, is_transactions=is_transactions
+        )
+        return client.get_json(request_path, params=params, label=endpoint_label), started
+
+    @staticmethod
+    def _normalise_next_page_path(
         base_path: str,
         next_page_path: str,
+        *,
+        is_transactions: bool,
     ) -> Tuple[str, Dict[str, Any] | None]:
         """Convert API `nextPagePath` strings into client target + params."""
-        # Handle query-string-only paths
-        if next_page_path.startswith("?"):
-            next_page_path = base_path + next_page_path
-        elif not next_page_path.startswith(("http://", "https://", "/")):
-            # Bare query string without ?
-            next_page_path = f"{base_path}?{next_page_path}"
-
-        # Parse URL
-        parsed = urlparse(next_page_path)
-
-        # Extract relative path
-        relative_path = parsed.path.lstrip("/")
-        if relative_path.startswith("api/v0/"):
-            relative_path = relative_path[len("api/v0/") :]
-        relative_path = relative_path or base_path
-
-        # Parse query params
-        params = dict(parse_qsl(parsed.query)) if parsed.query else None
+        relative_path, query_pairs = _split_next_path(next_page_path)
+        params = dict(query_pairs) or None
 
         # Remove 'time' parameter for transactions (API requirement)
-        if params and "transactions" in base_path and "time" in params:
-            del params["time"]
+        if params and is_transactions:
+            params.pop("time", None)
 
-        return relative_path, params
+        return relative_path or base_path, params
 
     @staticmethod
     def _format_endpoint(relative_path: str) -> str:
-        trimmed = relative_path.lstrip("/")
-        if not trimmed.startswith("api/v0/"):
-            trimmed = f"api/v0/{trimmed}"
-        return f"/{trimmed}"
+        return _format_endpoint(relative_path)
@@ -5,32 +5,149 @@ import hashlib
 import logging
 import urllib.parse
 from datetime import datetime, timezone
-from typing import Any, Iterable, Mapping
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Hashable, Iterable, Mapping, Sequence, Tuple
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.elements import TextClause
 
 from ..config import Settings, get_settings
+from ..transformers import OrderWithTaxes
 from ..utils import dumps_payload
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_BULK_BATCH_SIZE = 10_000
+
+# Natural keys used to collapse in-batch duplicates (mirroring database/schema.sql)
+_ORDER_KEY = itemgetter("order_id", "fill_id")
+_DIVIDEND_KEY = itemgetter("reference", "ticker")
+_TRANSACTION_KEY = itemgetter("reference", "transaction_type")
+_SCHEDULE_EVENT_KEY = itemgetter("working_schedule_id", "event_type", "event_time_utc")
+
+_DIVIDEND_COLUMNS = (
+    "account_id", "reference", "ticker", "dividend_type", "quantity",
+    "gross_amount_per_share", "amount_account_ccy", "amount_eur",
+    "paid_on_utc", "payload_json",
+)
+_TRANSACTION_COLUMNS = (
+    "account_id", "reference", "transaction_type", "amount_account_ccy",
+    "occurred_at_utc", "payload_json",
+)
+_PORTFOLIO_COLUMNS = (
+    "account_id", "captured_at_utc", "ticker", "quantity", "average_price",
+    "current_price", "ppl_amount", "fx_ppl_amount", "pie_quantity",
+    "max_buy_quantity", "max_sell_quantity", "initial_fill_date",
+    "frontend_origin", "payload_json",
+)
+_PENDING_ORDER_COLUMNS = (
+    "account_id", "captured_at_utc", "order_id", "ticker", "order_type",
+    "order_status", "strategy", "quantity", "value_amount", "limit_price",
+    "stop_price", "extended_hours", "filled_quantity", "filled_value",
+    "creation_time_utc", "payload_json",
+)
+_PIE_ALLOCATION_COLUMNS = (
+    "account_id", "captured_at_utc", "pie_id", "ticker",
+    "target_weight_pct", "actual_weight_pct", "quantity", "payload_json",
+)
+_EXCHANGE_COLUMNS = ("exchange_id", "exchange_name", "payload_json")
+_WORKING_SCHEDULE_COLUMNS = ("working_schedule_id", "exchange_id", "payload_json")
+_SCHEDULE_EVENT_COLUMNS = ("working_schedule_id", "event_type", "event_time_utc", "payload_json")
+_INSTRUMENT_COLUMNS = (
+    "ticker", "isin", "name", "short_name", "currency_code",
+    "instrument_type", "working_schedule_id", "max_open_quantity",
+    "added_on_utc", "payload_json",
+)
+
+
+def _unique_by(key: Callable[[Any], Hashable], rows: Iterable[Any]) -> dict[Hashable, Any]:
+    """Index ``rows`` by ``key`` in one C-level pass, keeping the first row per key."""
+
+    ordered = list(rows)
+    ordered.reverse()  # later duplicates are overwritten by earlier rows
+    return dict(zip(map(key, ordered), ordered))
+
+
+@lru_cache(maxsize=None)
+def _stage_statements(
+    stage_table: str, source_table: str, columns: Tuple[str, ...]
+) -> Tuple[TextClause, TextClause, str]:
+    """Return the drop, create and qmark insert SQL for a stage; built once per shape."""
+
+    column_list = ", ".join(columns)
+    return (
+        text(f"DROP TABLE IF EXISTS {stage_table}"),
+        text(f"SELECT TOP (0) {column_list} INTO {stage_table} FROM {source_table}"),
+        f"INSERT INTO {stage_table} ({column_list}) VALUES ({', '.join('?' * len(columns))})",
+    )
+
+
+@lru_cache(maxsize=None)
+def _snapshot_merge_statement(
+    table: str, stage_table: str, columns: Tuple[str, ...], key_columns: Tuple[str, ...]
+) -> TextClause:
+    """Return the account-scoped snapshot MERGE for ``table``; built once per table."""
+
+    return text(
+        f"""
+        WITH account_rows AS (
+            SELECT * FROM {table} WHERE account_id = :account_id
+        )
+        MERGE account_rows AS target
+        USING {stage_table} AS source
+        ON {" AND ".join(f"target.{column} = source.{column}" for column in key_columns)}
+        WHEN MATCHED THEN
+            UPDATE SET {", ".join(
+                f"{column} = source.{column}" for column in columns if column not in key_columns
+            )}
+        WHEN NOT MATCHED BY TARGET THEN
+            INSERT ({", ".join(columns)})
+            VALUES ({", ".join(f"source.{column}" for column in columns)})
+        WHEN NOT MATCHED BY SOURCE THEN
+            DELETE;
+        """
+    )
+
 
 def build_connection_string(settings: Settings | None = None) -> str:
     """Return a SQLAlchemy connection string based on environment variables."""
 
     config = settings or get_settings()
-    if config.sqlserver_username:
-        creds = f"UID={config.sqlserver_username};PWD={config.sqlserver_password};"
+    return _odbc_connection_string(
+        config.sqlserver_driver,
+        config.sqlserver_server,
+        config.sqlserver_database,
+        config.sqlserver_encrypt,
+        config.sqlserver_trust_cert,
+        config.sqlserver_username,
+        config.sqlserver_password,
+    )
+
+
+@lru_cache(maxsize=4)
+def _odbc_connection_string(
+    driver: str,
+    server: str,
+    database: str,
+    encrypt: str,
+    trust_cert: bool,
+    username: str | None,
+    password: str | None,
+) -> str:
+    """Assemble and quote the ``odbc_connect`` URL once per distinct configuration."""
+
+    if username:
+        creds = f"UID={username};PWD={password};"
     else:
         creds = "Trusted_Connection=yes;"
-    trust = "TrustServerCertificate=yes;" if config.sqlserver_trust_cert else ""
+    trust = "TrustServerCertificate=yes;" if trust_cert else ""
     odbc_str = (
-        f"Driver={{{config.sqlserver_driver}}};"
-        f"Server={config.sqlserver_server};"
-        f"Database={config.sqlserver_database};"
-        f"Encrypt={config.sqlserver_encrypt};"
+        f"Driver={{{driver}}};"
+        f"Server={server};"
+        f"Database={database};"
+        f"Encrypt={encrypt};"
         f"{trust}"
         f"{creds}"
     )
@@ -39,16 +156,103 @@ def build_connection_string(settings: Settings | None = None) -> str:
 
 
 def create_sql_engine(settings: Settings | None = None) -> Engine:
-    """Instantiate a SQLAlchemy engine with sensible defaults."""
+    """Return the process-wide SQLAlchemy engine for the configured database.
 
-    return create_engine(build_connection_string(settings), fast_executemany=True, future=True)
+    ``fast_executemany`` makes pyodbc bind list-of-params executions as column
+    arrays shipped in a single round-trip, so repository methods should pass
+    whole batches to ``conn.execute`` rather than looping per row.
+
+    Engines are cached per connection string, so every service instantiated in
+    a process shares one connection pool.
+    """
+
+    return _engine_for(build_connection_string(settings))
+
+
+@lru_cache(maxsize=None)
+def _engine_for(connection_string: str) -> Engine:
+    return create_engine(
+        connection_string,
+        fast_executemany=True,
+        future=True,
+        pool_size=8,  # room for the concurrent history/snapshot workers
+        max_overflow=4,
+        pool_pre_ping=False,  # skip the extra round-trip per checkout
+        pool_recycle=1800,
+    )
 
 
 class SqlServerRepository:
     """Thin repository encapsulating SQL Server persistence concerns."""
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: Engine, *, batch_size: int = DEFAULT_BULK_BATCH_SIZE) -> None:
         self.engine = engine
+        self.batch_size = batch_size
+
+    def _execute_batched(
+        self, conn: Connection, stmt: TextClause, rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """Execute ``stmt`` as executemany slices of at most ``batch_size`` rows.
+
+        Bounds the parameter arrays pyodbc allocates per call; all slices share
+        the caller's transaction, so there is still a single commit. Row mappings
+        are bound as-is: SQLAlchemy only reads them, so no per-row copy is made.
+        """
+
+        for start in range(0, len(rows), self.batch_size):
+            conn.execute(stmt, rows[start:start + self.batch_size])
+
+    def _stage_rows(
+        self,
+        conn: Connection,
+        stage_table: str,
+        source_table: str,
+        columns: Tuple[str, ...],
+        rows: Sequence[Mapping[str, Any]],
+    ) -> None:
+        """Bulk-load ``rows`` into a fresh ``#temp`` table shaped like ``source_table``.
+
+        The stage copies the target's column types via ``SELECT TOP (0) ... INTO``,
+        so pyodbc binds every slice as typed parameter arrays and the follow-up
+        set-based statement needs no implicit conversions. Rows are projected to
+        positional tuples and sent straight to the driver, skipping the per-row
+        dict copy and named-parameter compilation of ``text()`` statements.
+        The stage statements are built once per stage shape and reused.
+        """
+
+        drop_stmt, create_stmt, insert_sql = _stage_statements(stage_table, source_table, columns)
+        conn.execute(drop_stmt)
+        conn.execute(create_stmt)
+        project = itemgetter(*columns)
+        for start in range(0, len(rows), self.batch_size):
+            conn.exec_driver_sql(insert_sql, list(map(project, rows[start:start + self.batch_size])))
+
+    def _replace_account_snapshot(
+        self,
+        table: str,
+        stage_table: str,
+        columns: Tuple[str, ...],
+        key_columns: Tuple[str, ...],
+        rows: Iterable[Mapping[str, Any]],
+    ) -> None:
+        """Make ``table`` hold exactly ``rows`` for their account in one MERGE.
+
+        Rows are staged, then merged into the account's slice of ``table``:
+        matched keys are updated, new keys inserted and keys missing from the
+        snapshot deleted. Readers never see the account's snapshot empty.
+        """
+
+        # Collapse in-batch duplicates: MERGE rejects a source matching a target row twice
+        unique_rows = list(_unique_by(itemgetter(*key_columns), rows).values())
+        if not unique_rows:
+            return
+
+        stmt = _snapshot_merge_statement(table, stage_table, columns, key_columns)
+
+        with self.engine.begin() as conn:
+            self._stage_rows(conn, stage_table, table, columns, unique_rows)
+            conn.execute(stmt, {"account_id": unique_rows[0]["account_id"]})
+            conn.execute(text(f"DROP TABLE {stage_table}"))
 
     # ------------------------------------------------------------------
     # Staging helpers
@@ -64,8 +268,41 @@ class SqlServerRepository:
         """Store a raw API response in the staging schema."""
 
         captured = captured_at or datetime.now(timezone.utc)
-        payload_json = dumps_payload(payload)
-        payload_hash = hashlib.sha256(payload_json.encode("utf-8")).digest()
+        self.record_raw_payloads(
+            [
+                {
+                    "endpoint": endpoint,
+                    "payload": payload,
+                    "account_id": account_id,
+                    "correlation_id": correlation_id,
+                    "captured_at": captured,
+                }
+            ]
+        )
+        return captured
+
+    def record_raw_payloads(self, entries: Sequence[Mapping[str, Any]]) -> None:
+        """Store several raw API responses with one batched insert.
+
+        Each entry carries ``endpoint``, ``payload``, ``account_id``,
+        ``correlation_id`` and ``captured_at`` (as accepted by ``record_raw_payload``).
+        """
+
+        rows = []
+        for entry in entries:
+            payload_json = dumps_payload(entry["payload"])
+            rows.append(
+                {
+                    "endpoint": entry["endpoint"],
+                    "account_id": entry.get("account_id"),
+                    "captured_at_utc": entry.get("captured_at") or datetime.now(timezone.utc),
+                    "correlation_id": entry.get("correlation_id"),
+                    "payload_hash": hashlib.sha256(payload_json.encode("utf-8")).digest(),
+                    "payload_json": payload_json,
+                }
+            )
+        if not rows:
+            return
 
         stmt = text(
             """
@@ -75,18 +312,7 @@ class SqlServerRepository:
             """
         )
         with self.engine.begin() as conn:
-            conn.execute(
-                stmt,
-                {
-                    "endpoint": endpoint,
-                    "account_id": account_id,
-                    "captured_at_utc": captured,
-                    "correlation_id": correlation_id,
-                    "payload_hash": payload_hash,
-                    "payload_json": payload_json,
-                },
-            )
-        return captured
+            self._execute_batched(conn, stmt, rows)
 
     # ------------------------------------------------------------------
     # Account profile
@@ -99,7 +325,10 @@ class SqlServerRepository:
             MERGE core.account_profile AS target
             USING (VALUES (:account_id, :currency_code, :seen_at)) AS source(account_id, currency_code, seen_at)
             ON target.account_id = source.account_id
-            WHEN MATCHED THEN
+            WHEN MATCHED AND (
+                target.currency_code <> source.currency_code
+                OR target.last_seen_at < source.seen_at
+            ) THEN
                 UPDATE SET
                     target.currency_code = source.currency_code,
                     target.last_seen_at = source.seen_at
@@ -142,110 +371,125 @@ class SqlServerRepository:
             conn.execute(stmt, dict(row))
 
     def insert_portfolio_snapshots(self, rows: Iterable[Mapping[str, Any]]) -> None:
-        """Replace portfolio snapshots - clear old data and insert new snapshot."""
-        
-        # Clear existing portfolio snapshots for this account
-        delete_stmt = text("DELETE FROM core.portfolio_position_snapshot WHERE account_id = :account_id")
-        
-        insert_stmt = text(
-            """
-            INSERT INTO core.portfolio_position_snapshot (
-                account_id, captured_at_utc, ticker, quantity, average_price,
-                current_price, ppl_amount, fx_ppl_amount, pie_quantity,
-                max_buy_quantity, max_sell_quantity, initial_fill_date,
-                frontend_origin, payload_json
-            )
-            VALUES (
-                :account_id, :captured_at_utc, :ticker, :quantity, :average_price,
-                :current_price, :ppl_amount, :fx_ppl_amount, :pie_quantity,
-                :max_buy_quantity, :max_sell_quantity, :initial_fill_date,
-                :frontend_origin, :payload_json
-            )
-            """
+        """Replace the account's portfolio snapshot with ``rows``."""
+
+        self._replace_account_snapshot(
+            "core.portfolio_position_snapshot",
+            "#portfolio_stage",
+            _PORTFOLIO_COLUMNS,
+            ("account_id", "ticker"),
+            rows,
         )
 
-        with self.engine.begin() as conn:
-            rows_list = list(rows)  # Convert to list so we can use it twice
-            if rows_list:
-                # Clear existing snapshots for this account
-                account_id = rows_list[0].get("account_id")
-                conn.execute(delete_stmt, {"account_id": account_id})
-                
-                # Insert new snapshots
-                for row in rows_list:
-                    conn.execute(insert_stmt, dict(row))
-
     def insert_pending_order_snapshots(self, rows: Iterable[Mapping[str, Any]]) -> None:
-        """Replace pending order snapshots - clear old data and insert new snapshot."""
-        
-        # Clear existing pending orders for this account
-        delete_stmt = text("DELETE FROM core.pending_order_snapshot WHERE account_id = :account_id")
-        
-        insert_stmt = text(
-            """
-            INSERT INTO core.pending_order_snapshot (
-                account_id, captured_at_utc, order_id, ticker, order_type,
-                order_status, strategy, quantity, value_amount, limit_price,
-                stop_price, extended_hours, filled_quantity, filled_value,
-                creation_time_utc, payload_json
-            )
-            VALUES (
-                :account_id, :captured_at_utc, :order_id, :ticker, :order_type,
-                :order_status, :strategy, :quantity, :value_amount, :limit_price,
-                :stop_price, :extended_hours, :filled_quantity, :filled_value,
-                :creation_time_utc, :payload_json
-            )
-            """
+        """Replace the account's pending order snapshot with ``rows``."""
+
+        self._replace_account_snapshot(
+            "core.pending_order_snapshot",
+            "#pending_order_stage",
+            _PENDING_ORDER_COLUMNS,
+            ("account_id", "order_id"),
+            rows,
         )
 
-        with self.engine.begin() as conn:
-            rows_list = list(rows)  # Convert to list so we can use it twice
-            if rows_list:
-                # Clear existing pending orders for this account
-                account_id = rows_list[0].get("account_id")
-                conn.execute(delete_stmt, {"account_id": account_id})
-                
-                # Insert new pending orders
-                for row in rows_list:
-                    conn.execute(insert_stmt, dict(row))
-
     def insert_pie_allocation_snapshots(self, rows: Iterable[Mapping[str, Any]]) -> None:
-        """Replace pie allocation snapshots - clear old data and insert new snapshot."""
-        
-        # Clear existing pie allocations for this account
-        delete_stmt = text("DELETE FROM core.pie_allocation_snapshot WHERE account_id = :account_id")
-        
-        insert_stmt = text(
-            """
-            INSERT INTO core.pie_allocation_snapshot (
-                account_id, captured_at_utc, pie_id, ticker, 
-                target_weight_pct, actual_weight_pct, quantity, payload_json
-            )
-            VALUES (
-                :account_id, :captured_at_utc, :pie_id, :ticker,
-                :target_weight_pct, :actual_weight_pct, :quantity, :payload_json
-            )
-            """
+        """Replace the account's pie allocation snapshot with ``rows``."""
+
+        self._replace_account_snapshot(
+            "core.pie_allocation_snapshot",
+            "#pie_allocation_stage",
+            _PIE_ALLOCATION_COLUMNS,
+            ("account_id", "pie_id", "ticker"),
+            rows,
         )
 
-        with self.engine.begin() as conn:
-            rows_list = list(rows)  # Convert to list so we can use it twice
-            if rows_list:
-                # Clear existing pie allocations for this account
-                account_id = rows_list[0].get("account_id")
-                conn.execute(delete_stmt, {"account_id": account_id})
-                
-                # Insert new pie allocations
-                for row in rows_list:
-                    conn.execute(insert_stmt, dict(row))
-
     # ------------------------------------------------------------------
     # Historical facts
     # ------------------------------------------------------------------
-    def insert_order_history(self, order_row: Mapping[str, Any], taxes: Iterable[Mapping[str, Any]] | None = None) -> None:
+    def fetch_order_history_keys(
+        self, account_id: int, order_ids: Iterable[int]
+    ) -> set[tuple[int, int | None]]:
+        """Return the stored ``(order_id, fill_id)`` keys among ``order_ids``.
+
+        The lookup is scoped to the given ids (one history page), so its cost
+        does not grow with the account's full order history.
+        """
+
+        order_ids = list(set(order_ids))
+        if not order_ids:
+            return set()
+
         stmt = text(
             """
-            INSERT INTO core.order_history (
+            SELECT order_id, fill_id
+            FROM core.order_history
+            WHERE account_id = :account_id
+              AND order_id IN :order_ids
+            """
+        ).bindparams(bindparam("order_ids", expanding=True))
+
+        with self.engine.connect() as conn:
+            result = conn.execute(stmt, {"account_id": account_id, "order_ids": order_ids})
+            return {(row[0], row[1]) for row in result}
+
+    def insert_order_history_batch(self, bundles: Iterable[OrderWithTaxes]) -> int:
+        """Bulk-insert orders and their taxes, skipping orders already stored.
+
+        Orders and taxes are staged in temp tables with batched executemany and
+        moved into the core tables with two set-based statements in one
+        transaction. Taxes are only written for newly inserted orders. Returns
+        the number of orders inserted.
+        """
+
+        # Collapse in-batch duplicates on the (order_id, fill_id) natural key
+        unique_bundles = _unique_by(lambda bundle: _ORDER_KEY(bundle.order), bundles)
+        if not unique_bundles:
+            return 0
+
+        order_rows = [bundle.order for bundle in unique_bundles.values()]
+        tax_rows = [
+            {
+                "order_id": order_id,
+                "order_fill_id": order_fill_id,
+                "fill_id": tax.get("fill_id"),
+                "tax_name": tax.get("tax_name"),
+                "tax_quantity": tax.get("tax_quantity"),
+                "time_charged_utc": tax.get("time_charged_utc"),
+                "payload_json": tax.get("payload_json"),
+            }
+            for (order_id, order_fill_id), bundle in unique_bundles.items()
+            for tax in bundle.taxes or ()
+        ]
+
+        create_stage_stmt = text(
+            """
+            SELECT TOP (0)
+                account_id, order_id, parent_order_id, ticker, order_type,
+                order_status, time_validity, executor, extended_hours,
+                ordered_quantity, ordered_value, filled_quantity, filled_value,
+                fill_price, fill_cost, fill_result, fill_type, fill_id,
+                limit_price, stop_price, placed_at_utc, executed_at_utc,
+                modified_at_utc, payload_json
+            INTO #order_stage
+            FROM core.order_history;
+
+            SELECT TOP (0)
+                h.order_id, h.fill_id AS order_fill_id, t.fill_id, t.tax_name,
+                t.tax_quantity, t.time_charged_utc, t.payload_json
+            INTO #order_tax_stage
+            FROM core.order_history AS h
+            CROSS JOIN core.order_history_tax AS t;
+
+            SELECT TOP (0)
+                CAST(order_history_id AS BIGINT) AS order_history_id, order_id, fill_id
+            INTO #order_inserted
+            FROM core.order_history;
+            """
+        )
+
+        order_stage_stmt = text(
+            """
+            INSERT INTO #order_stage (
                 account_id, order_id, parent_order_id, ticker, order_type,
                 order_status, time_validity, executor, extended_hours,
                 ordered_quantity, ordered_value, filled_quantity, filled_value,
@@ -253,7 +497,6 @@ class SqlServerRepository:
                 limit_price, stop_price, placed_at_utc, executed_at_utc,
                 modified_at_utc, payload_json
             )
-            OUTPUT inserted.order_history_id
             VALUES (
                 :account_id, :order_id, :parent_order_id, :ticker, :order_type,
                 :order_status, :time_validity, :executor, :extended_hours,
@@ -265,111 +508,187 @@ class SqlServerRepository:
             """
         )
 
-        select_stmt = text(
+        tax_stage_stmt = text(
             """
-            SELECT order_history_id
-            FROM core.order_history
-            WHERE order_id = :order_id
-              AND ((fill_id IS NULL AND :fill_id IS NULL) OR fill_id = :fill_id)
+            INSERT INTO #order_tax_stage (
+                order_id, order_fill_id, fill_id, tax_name, tax_quantity,
+                time_charged_utc, payload_json
+            )
+            VALUES (
+                :order_id, :order_fill_id, :fill_id, :tax_name, :tax_quantity,
+                :time_charged_utc, :payload_json
+            )
+            """
+        )
+
+        insert_orders_stmt = text(
+            """
+            INSERT INTO core.order_history (
+                account_id, order_id, parent_order_id, ticker, order_type,
+                order_status, time_validity, executor, extended_hours,
+                ordered_quantity, ordered_value, filled_quantity, filled_value,
+                fill_price, fill_cost, fill_result, fill_type, fill_id,
+                limit_price, stop_price, placed_at_utc, executed_at_utc,
+                modified_at_utc, payload_json
+            )
+            OUTPUT inserted.order_history_id, inserted.order_id, inserted.fill_id
+                INTO #order_inserted (order_history_id, order_id, fill_id)
+            SELECT
+                account_id, order_id, parent_order_id, ticker, order_type,
+                order_status, time_validity, executor, extended_hours,
+                ordered_quantity, ordered_value, filled_quantity, filled_value,
+                fill_price, fill_cost, fill_result, fill_type, fill_id,
+                limit_price, stop_price, placed_at_utc, executed_at_utc,
+                modified_at_utc, payload_json
+            FROM #order_stage AS s
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM core.order_history AS h
+                WHERE h.order_id = s.order_id
+                  AND ((h.fill_id IS NULL AND s.fill_id IS NULL) OR h.fill_id = s.fill_id)
+            )
             """
         )
 
-        tax_stmt = text(
+        insert_taxes_stmt = text(
             """
             INSERT INTO core.order_history_tax (
                 order_history_id, fill_id, tax_name, tax_quantity, time_charged_utc, payload_json
             )
-            VALUES (:order_history_id, :fill_id, :tax_name, :tax_quantity, :time_charged_utc, :payload_json)
+            SELECT i.order_history_id, t.fill_id, t.tax_name, t.tax_quantity,
+                   t.time_charged_utc, t.payload_json
+            FROM #order_tax_stage AS t
+            JOIN #order_inserted AS i
+              ON i.order_id = t.order_id
+             AND ((i.fill_id IS NULL AND t.order_fill_id IS NULL) OR i.fill_id = t.order_fill_id)
             """
         )
 
         with self.engine.begin() as conn:
-            order_history_id: int
-            try:
-                result = conn.execute(stmt, dict(order_row))
-                order_history_id = int(result.scalar_one())
-            except IntegrityError:
-                LOGGER.debug(
-                    "Order history duplicate detected for order %s / fill %s",
-                    order_row.get("order_id"),
-                    order_row.get("fill_id"),
+            conn.execute(
+                text(
+                    "DROP TABLE IF EXISTS #order_stage; "
+                    "DROP TABLE IF EXISTS #order_tax_stage; "
+                    "DROP TABLE IF EXISTS #order_inserted;"
                 )
-                result = conn.execute(select_stmt, {
-                    "order_id": order_row.get("order_id"),
-                    "fill_id": order_row.get("fill_id"),
-                })
-                existing = result.scalar_one()
-                order_history_id = int(existing)
-
-            if not taxes:
-                return
-
-            for tax in taxes:
-                try:
-                    conn.execute(
-                        tax_stmt,
-                        {
-                            "order_history_id": order_history_id,
-                            "fill_id": tax.get("fill_id"),
-                            "tax_name": tax.get("tax_name"),
-                            "tax_quantity": tax.get("tax_quantity"),
-                            "time_charged_utc": tax.get("time_charged_utc"),
-                            "payload_json": tax.get("payload_json"),
-                        },
-                    )
-                except IntegrityError:
-                    LOGGER.debug(
-                        "Duplicate tax row skipped for order_history_id=%s tax=%s",
-                        order_history_id,
-                        tax.get("tax_name"),
-                    )
-
-    def insert_dividend_history(self, rows: Iterable[Mapping[str, Any]]) -> None:
-        stmt = text(
+            )
+            conn.execute(create_stage_stmt)
+            self._execute_batched(conn, order_stage_stmt, order_rows)
+            if tax_rows:
+                self._execute_batched(conn, tax_stage_stmt, tax_rows)
+            inserted = conn.execute(insert_orders_stmt).rowcount
+            if tax_rows and inserted:
+                conn.execute(insert_taxes_stmt)
+            conn.execute(
+                text("DROP TABLE #order_stage; DROP TABLE #order_tax_stage; DROP TABLE #order_inserted;")
+            )
+
+        skipped = len(unique_bundles) - inserted
+        if skipped:
+            LOGGER.debug("Order history: %d duplicate orders skipped", skipped)
+        return inserted
+
+    def insert_dividend_history(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Bulk-insert dividends, skipping keys already stored. Returns rows inserted."""
+
+        # Collapse in-batch duplicates so the set-based insert cannot trip the unique index
+        unique_rows = _unique_by(_DIVIDEND_KEY, rows)
+        if not unique_rows:
+            return 0
+
+        insert_stmt = text(
             """
             INSERT INTO core.dividend_history (
                 account_id, reference, ticker, dividend_type, quantity,
                 gross_amount_per_share, amount_account_ccy, amount_eur,
                 paid_on_utc, payload_json
             )
-            VALUES (
-                :account_id, :reference, :ticker, :dividend_type, :quantity,
-                :gross_amount_per_share, :amount_account_ccy, :amount_eur,
-                :paid_on_utc, :payload_json
+            SELECT s.account_id, s.reference, s.ticker, s.dividend_type, s.quantity,
+                   s.gross_amount_per_share, s.amount_account_ccy, s.amount_eur,
+                   s.paid_on_utc, s.payload_json
+            FROM #dividend_stage AS s
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM core.dividend_history AS d
+                WHERE d.reference = s.reference
+                  AND d.ticker = s.ticker
             )
             """
         )
 
         with self.engine.begin() as conn:
-            for row in rows:
-                try:
-                    conn.execute(stmt, dict(row))
-                except IntegrityError:
-                    LOGGER.debug("Dividend history duplicate skipped for reference %s", row.get("reference"))
+            self._stage_rows(
+                conn,
+                "#dividend_stage",
+                "core.dividend_history",
+                _DIVIDEND_COLUMNS,
+                list(unique_rows.values()),
+            )
+            inserted = conn.execute(insert_stmt).rowcount
+            conn.execute(text("DROP TABLE #dividend_stage"))
+
+        skipped = len(unique_rows) - inserted
+        if skipped:
+            LOGGER.debug("Dividend history: %d duplicate rows skipped", skipped)
+        return inserted
+
+    def fetch_recent_transaction_keys(self, account_id: int, limit: int = 500) -> set[tuple[str, str]]:
+        """Return the ``(reference, transaction_type)`` keys of the newest transactions."""
 
-    def insert_transaction_history(self, rows: Iterable[Mapping[str, Any]]) -> None:
         stmt = text(
+            """
+            SELECT TOP (:limit) reference, transaction_type
+            FROM core.transaction_history
+            WHERE account_id = :account_id
+            ORDER BY occurred_at_utc DESC
+            """
+        )
+
+        with self.engine.connect() as conn:
+            result = conn.execute(stmt, {"account_id": account_id, "limit": limit})
+            return {(row[0], row[1]) for row in result}
+
+    def insert_transaction_history(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Bulk-insert transactions, skipping keys already stored. Returns rows inserted."""
+
+        # Collapse in-batch duplicates so the set-based insert cannot trip the unique index
+        unique_rows = _unique_by(_TRANSACTION_KEY, rows)
+        if not unique_rows:
+            return 0
+
+        insert_stmt = text(
             """
             INSERT INTO core.transaction_history (
                 account_id, reference, transaction_type, amount_account_ccy,
                 occurred_at_utc, payload_json
             )
-            VALUES (
-                :account_id, :reference, :transaction_type, :amount_account_ccy,
-                :occurred_at_utc, :payload_json
+            SELECT s.account_id, s.reference, s.transaction_type, s.amount_account_ccy,
+                   s.occurred_at_utc, s.payload_json
+            FROM #tx_stage AS s
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM core.transaction_history AS t
+                WHERE t.reference = s.reference
+                  AND t.transaction_type = s.transaction_type
             )
             """
         )
 
         with self.engine.begin() as conn:
-            for row in rows:
-                try:
-                    conn.execute(stmt, dict(row))
-                except IntegrityError:
-                    LOGGER.debug(
-                        "Transaction history duplicate skipped for reference %s",
-                        row.get("reference"),
-                    )
+            self._stage_rows(
+                conn,
+                "#tx_stage",
+                "core.transaction_history",
+                _TRANSACTION_COLUMNS,
+                list(unique_rows.values()),
+            )
+            inserted = conn.execute(insert_stmt).rowcount
+            conn.execute(text("DROP TABLE #tx_stage"))
+
+        skipped = len(unique_rows) - inserted
+        if skipped:
+            LOGGER.debug("Transaction history: %d duplicate rows skipped", skipped)
+        return inserted
 
     # ------------------------------------------------------------------
     # Metadata helpers
@@ -380,13 +699,25 @@ class SqlServerRepository:
         working_schedules: Iterable[Mapping[str, Any]],
         schedule_events: Iterable[Mapping[str, Any]],
     ) -> None:
+        """Bulk-load exchanges, schedules and events, merging each level in one statement.
+
+        Matched rows are only rewritten when their payload changed, so a refresh of
+        unchanged metadata touches no pages and writes no log records.
+        """
+
+        # Collapse in-batch duplicates: MERGE rejects a source matching a target row twice
+        exchange_rows = list(_unique_by(itemgetter("exchange_id"), exchanges).values())
+        schedule_rows = list(_unique_by(itemgetter("working_schedule_id"), working_schedules).values())
+        event_rows = list(_unique_by(_SCHEDULE_EVENT_KEY, schedule_events).values())
+
         exchange_stmt = text(
             """
             MERGE core.exchange AS target
-            USING (VALUES (:exchange_id, :exchange_name, :payload_json))
-                AS source(exchange_id, exchange_name, payload_json)
+            USING #exchange_stage AS source
             ON target.exchange_id = source.exchange_id
-            WHEN MATCHED THEN
+            WHEN MATCHED AND (
+                target.payload_json IS NULL OR target.payload_json <> source.payload_json
+            ) THEN
                 UPDATE SET exchange_name = source.exchange_name, payload_json = source.payload_json
             WHEN NOT MATCHED THEN
                 INSERT (exchange_id, exchange_name, payload_json)
@@ -397,10 +728,13 @@ class SqlServerRepository:
         schedule_stmt = text(
             """
             MERGE core.working_schedule AS target
-            USING (VALUES (:working_schedule_id, :exchange_id, :payload_json))
-                AS source(working_schedule_id, exchange_id, payload_json)
+            USING #schedule_stage AS source
             ON target.working_schedule_id = source.working_schedule_id
-            WHEN MATCHED THEN
+            WHEN MATCHED AND (
+                target.exchange_id <> source.exchange_id
+                OR target.payload_json IS NULL
+                OR target.payload_json <> source.payload_json
+            ) THEN
                 UPDATE SET exchange_id = source.exchange_id, payload_json = source.payload_json
             WHEN NOT MATCHED THEN
                 INSERT (working_schedule_id, exchange_id, payload_json)
@@ -413,42 +747,70 @@ class SqlServerRepository:
             INSERT INTO core.working_schedule_event (
                 working_schedule_id, event_type, event_time_utc, payload_json
             )
-            VALUES (:working_schedule_id, :event_type, :event_time_utc, :payload_json)
+            SELECT s.working_schedule_id, s.event_type, s.event_time_utc, s.payload_json
+            FROM #event_stage AS s
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM core.working_schedule_event AS e
+                WHERE e.working_schedule_id = s.working_schedule_id
+                  AND e.event_type = s.event_type
+                  AND e.event_time_utc = s.event_time_utc
+            )
             """
         )
 
         with self.engine.begin() as conn:
-            for exchange in exchanges:
-                conn.execute(exchange_stmt, dict(exchange))
-
-            for schedule in working_schedules:
-                conn.execute(schedule_stmt, dict(schedule))
-
-            for event in schedule_events:
-                try:
-                    conn.execute(event_stmt, dict(event))
-                except IntegrityError:
-                    LOGGER.debug(
-                        "Schedule event duplicate skipped for schedule %s at %s",
-                        event.get("working_schedule_id"),
-                        event.get("event_time_utc"),
-                    )
+            if exchange_rows:
+                self._stage_rows(
+                    conn, "#exchange_stage", "core.exchange", _EXCHANGE_COLUMNS, exchange_rows
+                )
+                conn.execute(exchange_stmt)
+                conn.execute(text("DROP TABLE #exchange_stage"))
+
+            if schedule_rows:
+                self._stage_rows(
+                    conn,
+                    "#schedule_stage",
+                    "core.working_schedule",
+                    _WORKING_SCHEDULE_COLUMNS,
+                    schedule_rows,
+                )
+                conn.execute(schedule_stmt)
+                conn.execute(text("DROP TABLE #schedule_stage"))
+
+            if event_rows:
+                self._stage_rows(
+                    conn,
+                    "#event_stage",
+                    "core.working_schedule_event",
+                    _SCHEDULE_EVENT_COLUMNS,
+                    event_rows,
+                )
+                skipped = len(event_rows) - conn.execute(event_stmt).rowcount
+                conn.execute(text("DROP TABLE #event_stage"))
+                if skipped:
+                    LOGGER.debug("Schedule events: %d duplicate rows skipped", skipped)
 
     def upsert_instruments(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Bulk-load instruments into a stage and merge them in one statement.
+
+        Every column is derived from ``payload_json``, so rows whose payload is
+        unchanged are left alone instead of being rewritten on each refresh.
+        """
+
+        # Collapse in-batch duplicates: MERGE rejects a source matching a target row twice
+        unique_rows = _unique_by(itemgetter("ticker"), rows)
+        if not unique_rows:
+            return
+
         stmt = text(
             """
             MERGE core.instrument AS target
-            USING (VALUES (
-                :ticker, :isin, :name, :short_name, :currency_code,
-                :instrument_type, :working_schedule_id, :max_open_quantity,
-                :added_on_utc, :payload_json
-            )) AS source(
-                ticker, isin, name, short_name, currency_code,
-                instrument_type, working_schedule_id, max_open_quantity,
-                added_on_utc, payload_json
-            )
+            USING #instrument_stage AS source
             ON target.ticker = source.ticker
-            WHEN MATCHED THEN
+            WHEN MATCHED AND (
+                target.payload_json IS NULL OR target.payload_json <> source.payload_json
+            ) THEN
                 UPDATE SET
                     isin = source.isin,
                     name = source.name,
@@ -474,6 +836,12 @@ class SqlServerRepository:
         )
 
         with self.engine.begin() as conn:
-            for row in rows:
-                conn.execute(stmt, dict(row))
-
+            self._stage_rows(
+                conn,
+                "#instrument_stage",
+                "core.instrument",
+                _INSTRUMENT_COLUMNS,
+                list(unique_rows.values()),
+            )
+            conn.execute(stmt)
+            conn.execute(text("DROP TABLE #instrument_stage"))
@@ -0,0 +1,32 @@
+"""Shared pytest fixtures."""
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+import pytest
+
+from new_t212_client.client import T212Client
+from new_t212_client.config import Settings
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Offline settings that never read the environment or ``.env``."""
+
+    return Settings(
+        t212_api_key="key",
+        t212_api_secret="secret",
+        sqlserver_database="db",
+        _env_file=None,
+    )
+
+
+@pytest.fixture
+def client() -> Iterator[T212Client]:
+    """Live API client for test_endpoints_and_pagination; opt in with T212_LIVE_TESTS=1."""
+
+    if os.environ.get("T212_LIVE_TESTS") != "1":
+        pytest.skip("live Trading 212 API tests are disabled (set T212_LIVE_TESTS=1)")
+    with T212Client() as live_client:
+        yield live_client
@@ -57,6 +57,7 @@ def check_api(settings) -> dict[str, object]:
 
 
 def check_database(settings) -> bool:
+    # Process-wide engine: the probe's pooled connection is reused by --full-run
     engine = create_sql_engine(settings)
     try:
         with engine.connect() as conn:
@@ -85,8 +86,6 @@ def check_database(settings) -> bool:
             f"Detected drivers: {available}."
         )
         raise RuntimeError(message) from exc
-    finally:
-        engine.dispose()
 
 
 def main() -> None:
@@ -0,0 +1,119 @@
+"""Offline tests for T212Client caching and retry behaviour, via httpx.MockTransport."""
+from __future__ import annotations
+
+import time
+from typing import Callable, Iterator
+
+import httpx
+import pytest
+
+from new_t212_client import client as client_module
+from new_t212_client.client import T212Client, _ETagCache
+from new_t212_client.config import Settings
+from new_t212_client.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def make_client(settings: Settings, monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[..., T212Client]]:
+    """Build clients whose requests are answered by ``handler``; no network, no sleeping."""
+
+    monkeypatch.setattr(client_module, "_ETAG_CACHE", _ETagCache(client_module.ETAG_CACHE_SIZE))
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+    clients: list[T212Client] = []
+
+    def factory(
+        handler: Callable[[httpx.Request], httpx.Response], api_settings: Settings | None = None
+    ) -> T212Client:
+        api_settings = api_settings or settings
+        api_client = T212Client(api_settings)
+        api_client._client.close()
+        api_client._client = httpx.Client(
+            base_url=api_settings.base_url, transport=httpx.MockTransport(handler)
+        )
+        api_client._rate_limiter = RateLimiter()
+        clients.append(api_client)
+        return api_client
+
+    yield factory
+    for api_client in clients:
+        api_client.close()
+
+
+def test_etag_cache_evicts_the_least_recently_used_entry() -> None:
+    cache = _ETagCache(maxsize=2)
+    cache.put("a", ("etag-a", b"a"))
+    cache.put("b", ("etag-b", b"b"))
+    assert cache.get("a") == ("etag-a", b"a")  # "a" is now the most recent
+
+    cache.put("c", ("etag-c", b"c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ("etag-a", b"a")
+    assert cache.get("c") == ("etag-c", b"c")
+
+
+def test_conditional_get_reuses_the_cached_body_on_304(make_client) -> None:
+    seen_if_none_match: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_if_none_match.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{"id": 1}], headers={"etag": '"v1"'})
+
+    api_client = make_client(handler)
+
+    first = api_client.get_json("/equity/metadata/exchanges", conditional=True)
+    second = api_client.get_json("/equity/metadata/exchanges", conditional=True)
+
+    assert first == second == [{"id": 1}]
+    assert seen_if_none_match == [None, '"v1"']
+
+
+def test_conditional_cache_is_keyed_on_base_url(settings: Settings, make_client) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match"):
+            return httpx.Response(304)
+        return httpx.Response(200, json={"host": request.url.host}, headers={"etag": '"v1"'})
+
+    demo = make_client(handler)
+    live = make_client(handler, settings.model_copy(update={"t212_api_env": "live"}))
+
+    assert demo.get_json("/equity/metadata/instruments", conditional=True) == {
+        "host": "demo.trading212.com"
+    }
+    assert live.get_json("/equity/metadata/instruments", conditional=True) == {
+        "host": "live.trading212.com"
+    }
+
+
+def test_304_without_conditional_headers_is_raised(make_client) -> None:
+    api_client = make_client(lambda request: httpx.Response(304))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        api_client.get("/equity/portfolio")
+
+
+def test_429_retry_waits_once_for_the_reset(make_client, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    limiter_waits: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        headers = {
+            "x-ratelimit-limit": "6",
+            "x-ratelimit-period": "60",
+            "x-ratelimit-remaining": "0",
+            "x-ratelimit-reset": str(int(time.time()) + 60),
+        }
+        if len(calls) == 1:
+            return httpx.Response(429, headers=headers)
+        return httpx.Response(200, json={"ok": True}, headers=headers)
+
+    api_client = make_client(handler)
+    monkeypatch.setattr(api_client._rate_limiter, "wait", limiter_waits.append)
+
+    assert api_client.get_json("/history/dividends", label="history/dividends") == {"ok": True}
+    assert len(calls) == 2
+    # Only the first attempt reserves through the limiter; the retry follows the reset sleep
+    assert limiter_waits == ["history/dividends"]
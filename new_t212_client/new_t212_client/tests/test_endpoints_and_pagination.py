@@ -1,11 +1,13 @@
 """Test all endpoints and pagination logic."""
 from __future__ import annotations
 
+import io
 import sys
-import time
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 # Setup path before imports
 PACKAGE_ROOT = Path(__file__).resolve().parents[1]
@@ -22,6 +24,31 @@ from new_t212_client.endpoints.history import HistoryEndpoints  # noqa: E402
 from new_t212_client.endpoints.metadata import MetadataEndpoints  # noqa: E402
 from new_t212_client.endpoints.portfolio import PortfolioEndpoints  # noqa: E402
 from new_t212_client.logging_config import configure_logging  # noqa: E402
+from new_t212_client.services.ingestion import _split_next_path  # noqa: E402
+
+
+class _ThreadRoutedStdout(io.TextIOBase):
+    """Send prints from worker threads to per-thread buffers, others to the real stdout."""
+
+    def __init__(self, target: Any) -> None:
+        self._target = target
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._target).write(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def capture(
+        self, test: Callable[[T212Client], dict[str, Any]], client: T212Client
+    ) -> tuple[dict[str, Any], str]:
+        """Run ``test`` with its output buffered; return its result and the output."""
+        self._local.buffer = io.StringIO()
+        try:
+            return test(client), self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
 
 
 def test_account_endpoints(client: T212Client) -> dict[str, Any]:
@@ -143,28 +170,13 @@ def test_history_endpoints_and_pagination(client: T212Client) -> dict[str, Any]:
     page_count = 1
 
     while next_page:
-        # Rate limit: 6 requests per minute for historical orders
-        # Wait 10 seconds between pages to stay under limit (6 requests/60s = 1 per 10s)
-        print("  Waiting 10 seconds for rate limit...")
-        time.sleep(10)
-
-        # Parse the next page path properly
-        from urllib.parse import urlparse, parse_qsl
-
-        parsed = urlparse(next_page)
-
-        # Extract path and query parameters
-        if parsed.query:
-            # Has query string
-            params = dict(parse_qsl(parsed.query))
-            page_response = endpoints.fetch_orders(params=params)
-        elif next_page.startswith("?"):
-            # Just query string
-            params = dict(parse_qsl(next_page[1:]))
-            page_response = endpoints.fetch_orders(params=params)
-        else:
+        # Rate limit: 6 requests per minute for historical orders. The client's
+        # header-seeded token bucket waits only when the remaining budget is spent.
+        _, query_pairs = _split_next_path(next_page)
+        if not query_pairs:
             print(f"  Warning: Unexpected nextPagePath format: {next_page}")
             break
+        page_response = endpoints.fetch_orders(params=dict(query_pairs))
 
         page_items = page_response.get("items", [])
         page_count += 1
@@ -237,8 +249,12 @@ def test_rate_limiting_headers(client: T212Client) -> dict[str, Any]:
     if not headers:
         print("  Warning: No rate limit headers found in response")
 
+    # HTTP/2 (with h2 installed) multiplexes every test over one pooled connection
+    print(f"✓ Protocol: {response.http_version}")
+
     return {
         "rate_limit_headers": headers,
+        "http_version": response.http_version,
     }
 
 
@@ -257,13 +273,33 @@ def run_all_tests() -> None:
     all_results = {}
 
     try:
-        with T212Client(settings) as client:
-            # Test all endpoints
-            all_results["account"] = test_account_endpoints(client)
-            all_results["portfolio"] = test_portfolio_endpoints(client)
-            all_results["metadata"] = test_metadata_endpoints(client)
-            all_results["history"] = test_history_endpoints_and_pagination(client)
-            all_results["rate_limiting"] = test_rate_limiting_headers(client)
+        # Independent endpoints run on worker threads (T212Client is thread-safe) while
+        # the rate-limited history test runs here; buffered output is printed in order.
+        independent_tests = {
+            "account": test_account_endpoints,
+            "portfolio": test_portfolio_endpoints,
+            "metadata": test_metadata_endpoints,
+            "rate_limiting": test_rate_limiting_headers,
+        }
+        real_stdout = sys.stdout
+        stdout = _ThreadRoutedStdout(real_stdout)
+        sys.stdout = stdout
+        try:
+            with T212Client(settings) as client, ThreadPoolExecutor(
+                max_workers=len(independent_tests)
+            ) as pool:
+                futures = {
+                    name: pool.submit(stdout.capture, test, client)
+                    for name, test in independent_tests.items()
+                }
+                all_results["history"] = test_history_endpoints_and_pagination(client)
+                outputs = []
+                for name, future in futures.items():
+                    all_results[name], output = future.result()
+                    outputs.append(output)
+        finally:
+            sys.stdout = real_stdout
+        print("".join(outputs), end="")
 
         # Print summary
         print("\n" + "=" * 80)
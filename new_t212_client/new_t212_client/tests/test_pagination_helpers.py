@@ -0,0 +1,62 @@
+"""Offline tests for cursor parsing and in-batch dedup helpers."""
+from __future__ import annotations
+
+from operator import itemgetter
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+
+from new_t212_client.services.ingestion import _split_next_path
+from new_t212_client.storage.sql_server import _unique_by
+
+
+@pytest.mark.parametrize(
+    ("next_page_path", "expected"),
+    [
+        (
+            "/api/v0/equity/history/orders?limit=50&cursor=1700000000000",
+            ("equity/history/orders", (("limit", "50"), ("cursor", "1700000000000"))),
+        ),
+        ("?cursor=abc&limit=20", ("", (("cursor", "abc"), ("limit", "20")))),
+        ("cursor=abc", ("", (("cursor", "abc"),))),
+        ("/history/dividends?cursor=a%2Bb+c&&flag&empty=", ("history/dividends", (("cursor", "a+b c"),))),
+        (
+            "https://demo.trading212.com/api/v0/history/transactions?cursor=x&limit=50",
+            ("history/transactions", (("cursor", "x"), ("limit", "50"))),
+        ),
+    ],
+)
+def test_split_next_path(next_page_path: str, expected: tuple) -> None:
+    assert _split_next_path(next_page_path) == expected
+
+
+def test_split_next_path_matches_parse_qsl_for_relative_cursors() -> None:
+    path = "/api/v0/equity/history/orders?limit=50&cursor=17%3A00&ticker=AAPL_US_EQ"
+
+    _, pairs = _split_next_path(path)
+    assert pairs == tuple(parse_qsl(urlparse(path).query))
+
+
+def test_unique_by_keeps_the_first_row_per_key() -> None:
+    rows = [
+        {"reference": "a", "transaction_type": "DEPOSIT", "n": 1},
+        {"reference": "b", "transaction_type": "DEPOSIT", "n": 2},
+        {"reference": "a", "transaction_type": "DEPOSIT", "n": 3},
+        {"reference": "a", "transaction_type": "FEE", "n": 4},
+    ]
+
+    unique = _unique_by(itemgetter("reference", "transaction_type"), rows)
+
+    assert {key: row["n"] for key, row in unique.items()} == {
+        ("a", "DEPOSIT"): 1,
+        ("b", "DEPOSIT"): 2,
+        ("a", "FEE"): 4,
+    }
+
+
+def test_unique_by_accepts_iterators_and_empty_input() -> None:
+    assert _unique_by(itemgetter("id"), iter([])) == {}
+    assert _unique_by(itemgetter("id"), ({"id": i % 2} for i in range(5))) == {
+        0: {"id": 0},
+        1: {"id": 1},
+    }
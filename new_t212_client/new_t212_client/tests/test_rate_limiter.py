@@ -0,0 +1,103 @@
+"""Offline tests for the header-driven token bucket rate limiter."""
+from __future__ import annotations
+
+import pytest
+
+from new_t212_client import rate_limiter as rate_limiter_module
+from new_t212_client.rate_limiter import RateLimiter, TokenBucket
+
+
+class _FakeClock:
+    """Monotonic and wall clock that only move when the test sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter_module.time, "time", fake.time)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", fake.sleep)
+    return fake
+
+
+def _headers(limit: int, period: int, remaining: int, reset: float) -> dict[str, str]:
+    return {
+        "x-ratelimit-limit": str(limit),
+        "x-ratelimit-period": str(period),
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(int(reset)),
+    }
+
+
+def test_token_bucket_refill_is_capped_at_capacity() -> None:
+    bucket = TokenBucket(capacity=5, refill_per_sec=1.0, tokens=0.0, last_refill=0.0)
+
+    bucket.refill(2.0)
+    assert bucket.tokens == 2.0
+    bucket.refill(100.0)
+    assert bucket.tokens == 5.0
+    assert bucket.last_refill == 100.0
+
+
+def test_wait_without_bucket_does_not_sleep(clock: _FakeClock) -> None:
+    RateLimiter().wait("equity/portfolio")
+
+    assert clock.sleeps == []
+
+
+def test_update_from_headers_ignores_incomplete_headers(clock: _FakeClock) -> None:
+    limiter = RateLimiter()
+    limiter.update_from_headers("equity/portfolio", {"x-ratelimit-limit": "5"})
+
+    limiter.wait("equity/portfolio")
+    assert clock.sleeps == []
+
+
+def test_wait_spends_remaining_tokens_then_sleeps_for_refill(clock: _FakeClock) -> None:
+    limiter = RateLimiter()
+    limiter.update_from_headers("history/dividends", _headers(6, 60, 2, clock.now + 60))
+
+    limiter.wait("history/dividends")
+    limiter.wait("history/dividends")
+    assert clock.sleeps == []
+
+    # Bucket is at zero: the server window is exhausted, so wait for its reset
+    limiter.wait("history/dividends")
+    assert clock.sleeps == [pytest.approx(60.0)]
+
+
+def test_queued_callers_wait_one_refill_interval_each(clock: _FakeClock) -> None:
+    limiter = RateLimiter()
+    limiter.update_from_headers("history/orders", _headers(6, 60, 1, clock.now))
+
+    limiter.wait("history/orders")
+    limiter.wait("history/orders")  # exhausted, but the reset is already due
+    limiter.wait("history/orders")
+
+    assert clock.sleeps == [pytest.approx(10.0), pytest.approx(10.0)]
+
+
+def test_update_from_headers_never_raises_the_balance(clock: _FakeClock) -> None:
+    limiter = RateLimiter()
+    limiter.update_from_headers("equity/orders", _headers(10, 10, 1, clock.now))
+    limiter.wait("equity/orders")  # reserve the last token
+
+    # A late response still reporting one remaining must not hand the token out again
+    limiter.update_from_headers("equity/orders", _headers(20, 10, 1, clock.now))
+    limiter.wait("equity/orders")
+
+    assert clock.sleeps == [pytest.approx(0.5)]
@@ -0,0 +1,72 @@
+"""Offline tests for the background raw payload writer."""
+from __future__ import annotations
+
+import threading
+from typing import Any, Mapping, Sequence
+
+import pytest
+
+from new_t212_client.services.ingestion import RawPayloadWriter
+
+
+class _RecordingRepository:
+    """Stands in for SqlServerRepository.record_raw_payloads."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.batches: list[list[Mapping[str, Any]]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def record_raw_payloads(self, entries: Sequence[Mapping[str, Any]]) -> None:
+        self.release.wait()
+        self.batches.append(list(entries))
+        if self.error is not None:
+            raise self.error
+
+
+def test_close_flushes_every_submitted_payload_in_order() -> None:
+    repository = _RecordingRepository()
+
+    with RawPayloadWriter(repository) as writer:
+        for index in range(5):
+            writer.submit(f"endpoint/{index}", {"index": index}, correlation_id="run")
+
+    staged = [entry for batch in repository.batches for entry in batch]
+    assert [entry["endpoint"] for entry in staged] == [f"endpoint/{i}" for i in range(5)]
+    assert all(entry["correlation_id"] == "run" for entry in staged)
+
+
+def test_payloads_queued_during_a_write_are_flushed_as_one_batch() -> None:
+    repository = _RecordingRepository()
+    repository.release.clear()
+    writer = RawPayloadWriter(repository)
+
+    writer.submit("first", {})
+    for index in range(3):
+        writer.submit(f"queued/{index}", {})
+    repository.release.set()
+    writer.close()
+
+    assert sum(len(batch) for batch in repository.batches) == 4
+    assert len(repository.batches) <= 2
+
+
+def test_close_reraises_the_first_write_error() -> None:
+    failure = RuntimeError("staging insert failed")
+    repository = _RecordingRepository(error=failure)
+    writer = RawPayloadWriter(repository)
+    writer.submit("equity/account/info", {"id": 1})
+
+    with pytest.raises(RuntimeError) as excinfo:
+        writer.close()
+    assert excinfo.value is failure
+
+
+def test_context_exit_does_not_mask_the_original_error() -> None:
+    repository = _RecordingRepository(error=RuntimeError("staging insert failed"))
+
+    with pytest.raises(KeyError):
+        with RawPayloadWriter(repository) as writer:
+            writer.submit("equity/account/info", {"id": 1})
+            raise KeyError("ingestion failed")
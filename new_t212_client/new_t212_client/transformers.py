@@ -1,18 +1,17 @@
 """Transform Trading212 API payloads into relational-friendly rows."""
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Iterable, List, Mapping, Sequence
+from typing import Any, Iterable, Iterator, List, Mapping, NamedTuple, Sequence
 
 from .utils import dumps_payload, parse_api_datetime, to_decimal
 
 SOURCE_SYSTEM = "api"
+_DECIMAL_ZERO = Decimal("0")
 
 
-@dataclass(frozen=True)
-class OrderWithTaxes:
+class OrderWithTaxes(NamedTuple):
     """Container for an order history row and associated tax records."""
 
     order: Mapping[str, Any]
@@ -87,6 +86,7 @@ def build_pie_allocation_rows(
     rows: List[Mapping[str, Any]] = []
     for pie_detail in pie_details:
         pie_id = pie_detail.get("settings", {}).get("id")
+        pie_key = str(pie_id) if pie_id else None  # shared by every instrument in the pie
         instruments = pie_detail.get("instruments", [])
 
         for instrument in instruments:
@@ -94,7 +94,7 @@ def build_pie_allocation_rows(
                 {
                     "account_id": account_id,
                     "captured_at_utc": captured_at,
-                    "pie_id": str(pie_id) if pie_id else None,
+                    "pie_id": pie_key,
                     "ticker": instrument.get("ticker"),
                     "target_weight_pct": to_decimal(instrument.get("expectedShare")),
                     "actual_weight_pct": to_decimal(instrument.get("currentShare")),
@@ -142,7 +142,14 @@ def build_order_history_items(
 ) -> List[OrderWithTaxes]:
     """Transform historical order payloads into database-ready structures."""
 
-    bundles: List[OrderWithTaxes] = []
+    return list(iter_order_history_items(account_id, items))
+
+
+def iter_order_history_items(
+    account_id: int, items: Iterable[Mapping[str, Any]]
+) -> Iterator[OrderWithTaxes]:
+    """Lazily transform historical order payloads, one bundle at a time."""
+
     for item in items:
         order_row = {
             "account_id": account_id,
@@ -179,22 +186,28 @@ def build_order_history_items(
                 {
                     "fill_id": tax.get("fillId"),
                     "tax_name": tax.get("name"),
-                    "tax_quantity": to_decimal(tax.get("quantity")) or Decimal("0"),
+                    "tax_quantity": to_decimal(tax.get("quantity")) or _DECIMAL_ZERO,
                     "time_charged_utc": parse_api_datetime(tax.get("timeCharged")),
                     "payload_json": dumps_payload(tax),
                 }
             )
 
-        bundles.append(OrderWithTaxes(order=order_row, taxes=tax_rows))
-
-    return bundles
+        yield OrderWithTaxes(order=order_row, taxes=tax_rows)
 
 
 def build_dividend_rows(
-    account_id: int, items: Iterable[Mapping[str, Any]]
+    account_id: int,
+    items: Iterable[Mapping[str, Any]],
+    fallback_time: datetime | None = None,
 ) -> List[Mapping[str, Any]]:
-    """Map dividend history items into curated rows."""
+    """Map dividend history items into curated rows.
+
+    ``fallback_time`` stamps items without a parseable timestamp; it is resolved
+    once per call rather than per row. Callers paging through a history should
+    pass their run's collection time so every page shares the same stamp.
+    """
 
+    fallback = fallback_time or datetime.now(timezone.utc)
     rows: List[Mapping[str, Any]] = []
     for item in items:
         rows.append(
@@ -205,10 +218,10 @@ def build_dividend_rows(
                 "dividend_type": item.get("type"),
                 "quantity": to_decimal(item.get("quantity")),
                 "gross_amount_per_share": to_decimal(item.get("grossAmountPerShare")),
-                "amount_account_ccy": to_decimal(item.get("amount")) or Decimal("0"),
+                "amount_account_ccy": to_decimal(item.get("amount")) or _DECIMAL_ZERO,
                 "amount_eur": to_decimal(item.get("amountInEuro")),
                 "paid_on_utc": (
-                    parse_api_datetime(item.get("paidOn")) or datetime.now(timezone.utc)
+                    parse_api_datetime(item.get("paidOn")) or fallback
                 ),
                 "payload_json": dumps_payload(item),
             }
@@ -217,10 +230,18 @@ def build_dividend_rows(
 
 
 def build_transaction_rows(
-    account_id: int, items: Iterable[Mapping[str, Any]]
+    account_id: int,
+    items: Iterable[Mapping[str, Any]],
+    fallback_time: datetime | None = None,
 ) -> List[Mapping[str, Any]]:
-    """Map cash transactions into curated rows."""
+    """Map cash transactions into curated rows.
+
+    ``fallback_time`` stamps items without a parseable timestamp; it is resolved
+    once per call rather than per row. Callers paging through a history should
+    pass their run's collection time so every page shares the same stamp.
+    """
 
+    fallback = fallback_time or datetime.now(timezone.utc)
     rows: List[Mapping[str, Any]] = []
     for item in items:
         rows.append(
@@ -228,9 +249,9 @@ def build_transaction_rows(
                 "account_id": account_id,
                 "reference": item.get("reference"),
                 "transaction_type": item.get("type"),
-                "amount_account_ccy": to_decimal(item.get("amount")) or Decimal("0"),
+                "amount_account_ccy": to_decimal(item.get("amount")) or _DECIMAL_ZERO,
                 "occurred_at_utc": (
-                    parse_api_datetime(item.get("dateTime")) or datetime.now(timezone.utc)
+                    parse_api_datetime(item.get("dateTime")) or fallback
                 ),
                 "payload_json": dumps_payload(item),
             }
@@ -7,11 +7,27 @@ from typing import Any
 
 import json
 
+try:  # optional C-accelerated JSON parser
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
+# json.dumps builds a new JSONEncoder per call whenever options are passed; build it once
+_encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
 
 def dumps_payload(payload: Any) -> str:
     """Serialise payloads using a consistent compact format."""
 
-    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return _encode_json(payload)
+
+
+def loads_payload(data: bytes) -> Any:
+    """Decode a raw JSON response body, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def parse_api_datetime(value: str | None) -> datetime | None:
@@ -25,9 +41,11 @@ def parse_api_datetime(value: str | None) -> datetime | None:
     if "+" not in normalised[10:]:  # no timezone info present
         normalised += "+00:00"
     try:
-        return datetime.fromisoformat(normalised).astimezone(timezone.utc)
+        parsed = datetime.fromisoformat(normalised)
     except ValueError:
         return None
+    # A "+00:00" suffix already parses to timezone.utc; only real offsets need converting
+    return parsed if parsed.tzinfo is timezone.utc else parsed.astimezone(timezone.utc)
 
 
 def to_decimal(value: Any) -> Decimal | None:
@@ -12,6 +12,7 @@ Total: ~5 API calls, runs in ~2 seconds.
 """
 
 import logging
+import time
 from datetime import datetime, timezone
 
 from new_t212_client.services.incremental import IncrementalCollectionService
@@ -25,6 +26,7 @@ def main():
     logger = logging.getLogger(__name__)
 
     start_time = datetime.now(timezone.utc)
+    start_mono = time.monotonic()
     logger.info("="*80)
     logger.info("STARTING INCREMENTAL HOURLY COLLECTION")
     logger.info("Started at: %s", start_time.isoformat())
@@ -36,8 +38,7 @@ def main():
         service = IncrementalCollectionService(settings)
         summary = service.run()
 
-        end_time = datetime.now(timezone.utc)
-        duration = (end_time - start_time).total_seconds()
+        duration = time.monotonic() - start_mono
 
         logger.info("="*80)
         logger.info("✓ COLLECTION COMPLETED SUCCESSFULLY")